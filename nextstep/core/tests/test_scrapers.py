@@ -1,6 +1,16 @@
+import io
+import json
+
 import pytest
 from unittest.mock import patch, MagicMock
 
+
+@pytest.fixture(autouse=True)
+def clear_response_cache():
+    from response_cache import get_response_cache
+    get_response_cache().clear()
+
+
 INTERNSHALA_HTML = """
 <html><body>
 <div class="individual_internship">
@@ -56,7 +66,7 @@ def test_internshala_parses_cards():
     mock_response.text = INTERNSHALA_HTML
     mock_response.raise_for_status = MagicMock()
 
-    with patch('requests.get', return_value=mock_response):
+    with patch('requests.Session.get', return_value=mock_response):
         results = scraper.fetch_opportunities()
 
     assert len(results) == 2
@@ -77,7 +87,7 @@ def test_internshala_wfh_sets_remote_location():
     mock_response.text = INTERNSHALA_HTML
     mock_response.raise_for_status = MagicMock()
 
-    with patch('requests.get', return_value=mock_response):
+    with patch('requests.Session.get', return_value=mock_response):
         results = scraper.fetch_opportunities()
 
     wfh = [r for r in results if 'web' in r.title.lower()]
@@ -126,8 +136,8 @@ def test_reddit_uses_oauth_when_credentials_set(monkeypatch):
     posts_resp.json.return_value = REDDIT_POSTS_RESPONSE
     posts_resp.raise_for_status = MagicMock()
 
-    with patch('requests.post', return_value=token_resp) as mock_post, \
-         patch('requests.get', return_value=posts_resp):
+    with patch('requests.Session.post', return_value=token_resp) as mock_post, \
+         patch('requests.Session.get', return_value=posts_resp):
         results = scraper.fetch_opportunities()
 
     mock_post.assert_called_once()
@@ -150,13 +160,88 @@ def test_reddit_falls_back_to_anonymous_without_credentials(monkeypatch):
     posts_resp.json.return_value = REDDIT_POSTS_RESPONSE
     posts_resp.raise_for_status = MagicMock()
 
-    with patch('requests.get', return_value=posts_resp) as mock_get:
+    with patch('requests.Session.get', return_value=posts_resp) as mock_get:
         results = scraper.fetch_opportunities()
 
     called_url = mock_get.call_args[0][0]
     assert 'reddit.com/r/' in called_url
 
 
+FORHIRE_POSTS_RESPONSE = {
+    "data": {
+        "children": [
+            {"data": {"title": "[HIRING] Django dev (Remote)", "selftext": "Contract role", "permalink": "/r/forhire/a"}},
+            {"data": {"title": "[Hiring] Designer - on-site in Pune", "selftext": "Full time", "permalink": "/r/forhire/b"}},
+            {"data": {"title": "[For Hire] Remote React developer", "selftext": "Hire me", "permalink": "/r/forhire/c"}},
+        ]
+    }
+}
+
+
+@pytest.mark.django_db
+def test_forhire_keeps_only_hiring_posts_and_detects_location():
+    from reddit_scraper import RedditForHireScraper
+
+    scraper = RedditForHireScraper(limit=10)
+
+    posts_resp = MagicMock(status_code=200, headers={})
+    posts_resp.content = json.dumps(FORHIRE_POSTS_RESPONSE).encode()
+    posts_resp.raise_for_status = MagicMock()
+
+    with patch('requests.Session.request', return_value=posts_resp):
+        results = scraper.fetch_opportunities()
+
+    assert [r.apply_link for r in results] == [
+        "https://www.reddit.com/r/forhire/a",
+        "https://www.reddit.com/r/forhire/b",
+    ]
+    assert results[0].location == "Remote"
+    assert results[0].job_type == "freelance"
+    assert results[1].location == "On-site (see description)"
+
+
+@pytest.mark.django_db
+def test_forhire_reuses_cached_response_within_ttl():
+    from reddit_scraper import RedditForHireScraper
+
+    posts_resp = MagicMock(status_code=200, headers={})
+    posts_resp.content = json.dumps(FORHIRE_POSTS_RESPONSE).encode()
+    posts_resp.raise_for_status = MagicMock()
+
+    with patch('requests.Session.request', return_value=posts_resp) as mock_request:
+        first = RedditForHireScraper(limit=10).fetch_opportunities()
+        second = RedditForHireScraper(limit=10).fetch_opportunities()
+
+    mock_request.assert_called_once()
+    assert [r.apply_link for r in second] == [r.apply_link for r in first]
+
+
+@pytest.mark.django_db
+def test_forhire_revalidates_expired_response_with_etag():
+    from reddit_scraper import RedditForHireScraper
+
+    posts_resp = MagicMock(status_code=200, headers={"ETag": '"v1"'})
+    posts_resp.content = json.dumps(FORHIRE_POSTS_RESPONSE).encode()
+    posts_resp.raise_for_status = MagicMock()
+    not_modified = MagicMock(status_code=304, headers={})
+
+    scraper = RedditForHireScraper(limit=10)
+    scraper.cache_ttl = 0  # expire immediately so the next fetch revalidates
+
+    with patch('requests.Session.request', side_effect=[posts_resp, not_modified]) as mock_request:
+        first = scraper.fetch_opportunities()
+        second = scraper.fetch_opportunities()
+
+    first_headers = mock_request.call_args_list[0].kwargs["headers"]
+    second_headers = mock_request.call_args_list[1].kwargs["headers"]
+    assert "If-None-Match" not in first_headers
+    assert second_headers["If-None-Match"] == '"v1"'
+    assert second_headers["User-Agent"] == scraper.headers["User-Agent"]
+    assert scraper._request_count == 2
+    assert [r.apply_link for r in second] == [r.apply_link for r in first]
+    assert scraper._response_cache.get_stats()["revalidated"] == 1
+
+
 ADZUNA_RESPONSE = {
     "results": [
         {
@@ -199,7 +284,7 @@ def test_adzuna_parses_response(monkeypatch):
     mock_response.raise_for_status = MagicMock()
     mock_response.status_code = 200
 
-    with patch('requests.request', return_value=mock_response):
+    with patch('requests.Session.request', return_value=mock_response):
         results = scraper.fetch_opportunities()
 
     assert len(results) == 2
@@ -225,7 +310,7 @@ def test_adzuna_deduplicates_across_queries(monkeypatch):
     mock_response.raise_for_status = MagicMock()
     mock_response.status_code = 200
 
-    with patch('requests.request', return_value=mock_response):
+    with patch('requests.Session.request', return_value=mock_response):
         results = scraper.fetch_opportunities()
 
     assert len(results) == 2
@@ -280,7 +365,7 @@ def test_themuse_parses_response():
             resp.json.return_value = MUSE_RESPONSE_EMPTY
         return resp
 
-    with patch('requests.request', side_effect=side_effect):
+    with patch('requests.Session.request', side_effect=side_effect):
         results = scraper.fetch_opportunities()
 
     assert len(results) >= 1
@@ -317,13 +402,143 @@ def test_themuse_skips_entries_without_apply_link():
     mock_resp.raise_for_status = MagicMock()
     mock_resp.status_code = 200
 
-    with patch('requests.request', return_value=mock_resp):
+    with patch('requests.Session.request', return_value=mock_resp):
         results = scraper.fetch_opportunities()
 
     assert len(results) == 0
 
 
-import json
+REMOTIVE_RESPONSES = {
+    "software-dev": {"jobs": [
+        {
+            "title": "Junior Backend Engineer",
+            "company_name": "RemoteCo",
+            "description": "<p>Build <b>APIs</b> with Django.</p>",
+            "salary": "$40k",
+            "job_type": "full_time",
+            "candidate_required_location": "Worldwide",
+            "url": "https://remotive.com/remote-jobs/software-dev/junior-backend-1",
+        },
+        {
+            "title": "Senior Engineer",
+            "company_name": "USCo",
+            "description": "<p>US only.</p>",
+            "job_type": "full_time",
+            "candidate_required_location": "USA Only",
+            "url": "https://remotive.com/remote-jobs/software-dev/senior-2",
+        },
+    ]},
+    "design": {"jobs": [
+        {
+            "title": "Product Designer",
+            "company_name": "DesignCo",
+            "description": "<div>Design things</div>",
+            "job_type": "contract",
+            "candidate_required_location": "India",
+            "url": "https://remotive.com/remote-jobs/design/designer-3",
+        },
+    ]},
+}
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("streaming", [True, False], ids=["ijson", "json"])
+def test_remotive_fetches_categories_concurrently_and_filters_location(streaming):
+    import remotive_scraper
+    from remotive_scraper import RemotiveScraper
+
+    if streaming:
+        pytest.importorskip("ijson")
+    ijson = remotive_scraper.ijson if streaming else None
+    scraper = RemotiveScraper(limit=10, categories=["software-dev", "design"])
+    scraper._rate_limiter = MagicMock(**{"wait.return_value": 0.0})
+
+    def side_effect(*args, params=None, **kwargs):
+        resp = MagicMock(status_code=200, headers={})
+        resp.content = json.dumps(REMOTIVE_RESPONSES[params["category"]]).encode()
+        resp.raw = io.BytesIO(resp.content)
+        return resp
+
+    with patch('requests.Session.request', side_effect=side_effect), \
+            patch.object(remotive_scraper, 'ijson', ijson):
+        results = scraper.fetch_opportunities()
+
+    by_title = {r.title: r for r in results}
+    assert set(by_title) == {"Junior Backend Engineer", "Product Designer"}
+
+    backend = by_title["Junior Backend Engineer"]
+    assert backend.job_type == "internship"
+    assert backend.description.startswith("Salary: $40k")
+    assert "<p>" not in backend.description and "APIs" in backend.description
+    assert backend.location == "Remote - Worldwide"
+
+    assert by_title["Product Designer"].job_type == "freelance"
+
+
+@pytest.mark.django_db
+def test_remotive_keeps_other_categories_when_one_body_is_truncated():
+    from remotive_scraper import RemotiveScraper
+
+    scraper = RemotiveScraper(limit=10, categories=["software-dev", "broken"])
+    scraper._rate_limiter = MagicMock(**{"wait.return_value": 0.0})
+
+    def side_effect(*args, params=None, **kwargs):
+        resp = MagicMock(status_code=200, headers={})
+        if params["category"] == "broken":
+            resp.content = b'{"jobs": [{"title": "Cut'
+        else:
+            resp.content = json.dumps(REMOTIVE_RESPONSES[params["category"]]).encode()
+        resp.raw = io.BytesIO(resp.content)
+        return resp
+
+    with patch('requests.Session.request', side_effect=side_effect):
+        results = scraper.fetch_opportunities()
+
+    assert [r.title for r in results] == ["Junior Backend Engineer"]
+
+
+@pytest.mark.parametrize("html, expected", [
+    ('<?xml version="1.0" encoding="utf-8"?><p>Build &amp; ship</p>', "Build & ship"),
+    ("<script>track()</script><style>p {}</style><p>Hello</p>", "Hello"),
+    ("<script>track()</script>", ""),
+    ("<!-- nothing here -->", ""),
+])
+def test_remotive_html_to_text_handles_odd_markup(html, expected):
+    from remotive_scraper import _html_to_text
+
+    assert _html_to_text(html).strip() == expected
+
+
+HN_ITEMS = {
+    "user/whoishiring": {"submitted": [100]},
+    "item/100": {"title": "Ask HN: Who is hiring? (October 2026)", "kids": [1, 2, 3, 4]},
+    "item/1": {"text": "Acme | Backend Engineer | Remote | Python and Django services, full time"},
+    "item/2": {"deleted": True},
+    "item/3": {"text": "Globex | Site Reliability Engineer | Onsite in Berlin only, no relocation"},
+    "item/4": {"text": "Initech | Data Intern | Bangalore, India | internship for final-year students"},
+}
+
+
+@pytest.mark.django_db
+def test_hackernews_fetches_comments_concurrently_in_thread_order():
+    from hackernews_scraper import HackerNewsScraper
+
+    scraper = HackerNewsScraper(max_comments=10)
+    scraper._rate_limiter = MagicMock(**{"wait.return_value": 0.0})
+
+    def side_effect(url, **kwargs):
+        resp = MagicMock()
+        resp.raise_for_status = MagicMock()
+        resp.json.return_value = HN_ITEMS[url.split("/v0/")[1].removesuffix(".json")]
+        return resp
+
+    with patch('requests.Session.get', side_effect=side_effect):
+        results = scraper.fetch_opportunities()
+
+    assert [r.company for r in results] == ["Acme", "Initech"]
+    assert results[0].apply_link == "https://news.ycombinator.com/item?id=1"
+    assert results[1].job_type == "internship"
+
 
 WELLFOUND_HTML = """<html><head></head><body>
 <script id="__NEXT_DATA__" type="application/json">
@@ -368,7 +583,7 @@ def test_wellfound_extracts_next_data():
     mock_resp.raise_for_status = MagicMock()
     mock_resp.status_code = 200
 
-    with patch('requests.request', return_value=mock_resp):
+    with patch('requests.Session.request', return_value=mock_resp):
         results = scraper.fetch_opportunities()
 
     assert len(results) == 2
@@ -393,7 +608,7 @@ def test_wellfound_returns_empty_when_no_next_data():
     mock_resp.raise_for_status = MagicMock()
     mock_resp.status_code = 200
 
-    with patch('requests.request', return_value=mock_resp):
+    with patch('requests.Session.request', return_value=mock_resp):
         results = scraper.fetch_opportunities()
 
     assert results == []
@@ -477,7 +692,7 @@ def test_unstop_parses_jobs():
     mock_resp.raise_for_status = MagicMock()
     mock_resp.status_code = 200
 
-    with patch('requests.request', return_value=mock_resp):
+    with patch('requests.Session.request', return_value=mock_resp):
         results = scraper.fetch_opportunities()
 
     assert len(results) == 2
@@ -503,7 +718,219 @@ def test_unstop_returns_empty_on_no_data():
     mock_resp.raise_for_status = MagicMock()
     mock_resp.status_code = 200
 
-    with patch('requests.request', return_value=mock_resp):
+    with patch('requests.Session.request', return_value=mock_resp):
         results = scraper.fetch_opportunities()
 
     assert results == []
+
+
+class _BarrierScraper:
+    """Fake scraper whose run() only returns once two instances are running."""
+
+    barrier = None
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+    def run(self):
+        self.barrier.wait()
+        return {'fetched': 3, 'saved': 2, 'duplicates': 1, 'errors': 0, 'retries': 0}
+
+
+@pytest.mark.django_db
+def test_orchestrator_runs_scrapers_concurrently_and_aggregates(tmp_path):
+    import threading
+    from run_all_scrapers import ScraperOrchestrator
+
+    _BarrierScraper.barrier = threading.Barrier(2, timeout=5)
+    config = {'class': _BarrierScraper, 'args': {}, 'quick_args': {}, 'description': 'fake'}
+
+    orchestrator = ScraperOrchestrator()
+    orchestrator.SCRAPERS = {'first': config, 'second': config}
+    orchestrator.OPTIONAL_SCRAPERS = {}
+    orchestrator.STATS_FILE = str(tmp_path / "scraper_stats.jsonl")
+
+    metrics = orchestrator.run_pipeline()
+
+    assert metrics.sources_run == 2
+    assert metrics.sources_success == 2
+    assert metrics.total_fetched == 6
+    assert metrics.total_saved == 4
+    assert metrics.total_duplicates == 2
+    assert set(metrics.source_metrics) == {'first', 'second'}
+
+    stats = json.loads((tmp_path / "scraper_stats.jsonl").read_text())
+    assert stats['total_saved'] == 4
+    assert stats['source_metrics']['first']['fetched'] == 3
+    assert 'start_time' not in stats and 'start_time' not in stats['source_metrics']['first']
+
+
+@pytest.mark.django_db
+def test_orchestrator_reuses_scraper_instance_across_runs():
+    from run_all_scrapers import ScraperOrchestrator
+
+    scraper_class = MagicMock()
+    scraper_class.return_value.run.return_value = {'fetched': 1, 'saved': 1}
+    config = {'class': scraper_class, 'args': {'limit': 5}, 'quick_args': {}, 'description': 'fake'}
+
+    orchestrator = ScraperOrchestrator()
+    orchestrator.run_scraper('fake', config)
+    metrics = orchestrator.run_scraper('fake', config)
+
+    scraper_class.assert_called_once_with(limit=5, session=orchestrator.http)
+    assert scraper_class.return_value.run.call_count == 2
+    assert metrics.saved == 1
+
+
+@pytest.mark.django_db
+def test_orchestrator_skips_unresolved_optional_scraper():
+    from run_all_scrapers import ScraperOrchestrator
+
+    orchestrator = ScraperOrchestrator()
+    metrics = orchestrator.run_scraper('internshala', orchestrator.OPTIONAL_SCRAPERS['internshala'])
+
+    assert metrics.status == "skipped"
+    assert metrics.errors == 0
+
+
+@pytest.mark.django_db
+def test_scheduled_scraper_functions_honour_force_rescrape():
+    from response_cache import get_response_cache
+    from run_all_scrapers import ScraperOrchestrator
+
+    scraper_class = MagicMock()
+    scraper_class.return_value.run.return_value = {'fetched': 1, 'saved': 1}
+    orchestrator = ScraperOrchestrator(force_rescrape=True)
+    orchestrator.SCRAPERS = {
+        'fake': {'class': scraper_class, 'args': {}, 'quick_args': {}, 'description': 'fake'},
+    }
+    orchestrator.OPTIONAL_SCRAPERS = {}
+
+    cache = get_response_cache()
+    cache.set(("https://example.com/api", ()), {"jobs": []})
+    orchestrator.get_scraper_functions()['fake']()
+
+    assert cache.get(("https://example.com/api", ())) is None
+    scraper_class.return_value.run.assert_called_once()
+
+
+def test_rate_limiter_staggers_concurrent_callers_by_min_delay():
+    from concurrent.futures import ThreadPoolExecutor
+    import rate_limiter
+    from rate_limiter import RateLimitConfig, RateLimiter
+
+    # Frozen clock and no-op sleep: each caller's reserved slot is exact
+    fake_time = MagicMock(**{"monotonic.return_value": 1000.0})
+
+    with patch.object(rate_limiter, 'time', fake_time):
+        limiter = RateLimiter('test', RateLimitConfig(requests_per_minute=600, min_delay=1.0))
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            waits = sorted(pool.map(lambda _: limiter.wait(), range(6)))
+
+    assert waits == [0.0, 1.0, 2.0, 3.0, 4.0, 5.0]
+    assert sorted(c.args[0] for c in fake_time.sleep.call_args_list) == waits[1:]
+
+
+def test_token_bucket_goes_into_debt_when_short():
+    import rate_limiter
+    from rate_limiter import TokenBucket
+
+    with patch.object(rate_limiter, 'time', MagicMock(**{"monotonic.return_value": 50.0})):
+        bucket = TokenBucket(tokens_per_second=1.0, max_tokens=2)
+        waits = [bucket.acquire() for _ in range(4)]
+
+    assert waits == [0.0, 0.0, 1.0, 2.0]
+    assert bucket.tokens == -2
+
+
+def test_schedule_kind_rejects_malformed_schedule():
+    from scheduler_config import schedule_kind
+
+    assert schedule_kind({'cron': {'hour': 9}}) == 'cron'
+    assert schedule_kind({'interval': {'hours': 6}}) == 'interval'
+    with pytest.raises(ValueError):
+        schedule_kind({'intervall': {'hours': 6}}, 'typo')
+    with pytest.raises(ValueError):
+        schedule_kind({'cron': {'hour': 9}, 'interval': {'hours': 6}})
+
+
+def test_config_schedules_get_a_fresh_trigger_per_scheduler():
+    pytest.importorskip("apscheduler")
+    from scheduler import ScraperScheduler
+
+    first, second = ScraperScheduler(blocking=False), ScraperScheduler(blocking=False)
+    first.add_scraper('remotive', print)
+    second.add_scraper('remotive', print)
+
+    assert first.jobs_info['remotive'] == ('interval', {'hours': 6})
+    assert first.scheduler.get_job('remotive').trigger is not second.scheduler.get_job('remotive').trigger
+
+
+def test_scheduled_runner_warns_about_disabled_scrapers(caplog):
+    pytest.importorskip("apscheduler")
+    from scheduler import create_scheduled_runner
+
+    scheduler = create_scheduled_runner({'reddit': print, 'internshala': print, 'retired': print})
+
+    assert set(scheduler.jobs_info) == {'reddit', 'internshala'}
+    assert any(
+        r.levelname == "WARNING" and "retired" in r.getMessage() for r in caplog.records
+    )
+
+
+class _FakeAsyncScheduler:
+    """Stand-in for APScheduler 4's AsyncScheduler that records its lifecycle."""
+
+    def __init__(self):
+        self.entered = False
+        self.added = []
+        self.stop_calls = 0
+
+    async def __aenter__(self):
+        import asyncio
+        self.entered = True
+        self._stopped = asyncio.Event()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.entered = False
+
+    async def add_schedule(self, func, trigger, id):
+        self.added.append((id, self.entered))
+
+    async def run_until_stopped(self):
+        import asyncio
+        import signal
+        signal.raise_signal(signal.SIGINT)
+        await asyncio.wait_for(self._stopped.wait(), timeout=5)
+
+    async def stop(self):
+        self.stop_calls += 1
+        self._stopped.set()
+
+
+def test_v4_blocking_scheduler_runs_on_asyncio_and_stops_on_sigint(monkeypatch):
+    import threading
+    from types import SimpleNamespace
+    import scheduler
+
+    if threading.current_thread() is not threading.main_thread():
+        pytest.skip("SIGINT handling needs the main thread")
+
+    monkeypatch.setattr(scheduler, '_apscheduler', lambda: SimpleNamespace(
+        v4=True,
+        AsyncScheduler=_FakeAsyncScheduler,
+        Scheduler=MagicMock(),
+        CronTrigger=MagicMock(),
+        IntervalTrigger=MagicMock(),
+    ))
+
+    runner = scheduler.ScraperScheduler(blocking=True)
+    runner.add_interval_job('pipeline', print, minutes=5)
+    runner.start()
+    runner.stop()
+
+    fake = runner.scheduler
+    assert fake.added == [('pipeline', True)]
+    assert fake.stop_calls == 1
+    assert not runner._is_running
@@ -12,7 +12,8 @@ Env vars required:
 import os
 import sys
 import logging
-from typing import List
+import requests
+from typing import List, Optional
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 PROJECT_DIR = os.path.join(BASE_DIR, "nextstep")
@@ -50,8 +51,13 @@ class AdzunaScraper(BaseScraper):
         "contract": "contract",
     }
 
-    def __init__(self, limit: int = 120, queries: List[str] = None):
-        super().__init__()
+    def __init__(
+        self,
+        limit: int = 120,
+        queries: List[str] = None,
+        session: Optional[requests.Session] = None,
+    ):
+        super().__init__(session=session)
         self.app_id = os.environ.get("ADZUNA_APP_ID", "")
         self.api_key = os.environ.get("ADZUNA_APP_KEY", "")
         self.limit = limit
@@ -8,10 +8,11 @@ API: https://arbeitnow.com/api/job-board-api
 """
 
 import os
+import re
 import sys
 import logging
 import requests
-from typing import List
+from typing import List, Optional
 
 # Setup Django
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -27,6 +28,8 @@ from base_scraper import BaseScraper, OpportunityData
 
 logger = logging.getLogger(__name__)
 
+_TAG_RE = re.compile(r'<[^>]+>')
+
 
 class ArbeitnowScraper(BaseScraper):
     """
@@ -48,8 +51,13 @@ class ArbeitnowScraper(BaseScraper):
     INTERN_KEYWORDS = ['intern', 'junior', 'entry', 'graduate', 'trainee', 'fresher']
     STARTUP_KEYWORDS = ['startup', 'early stage', 'seed', 'series a', 'funded']
     
-    def __init__(self, limit: int = 50, india_only: bool = True):
-        super().__init__()
+    def __init__(
+        self,
+        limit: int = 50,
+        india_only: bool = True,
+        session: Optional[requests.Session] = None,
+    ):
+        super().__init__(session=session)
         self.limit = limit
         self.india_only = india_only  # Default True — only remote/India jobs
     
@@ -83,10 +91,9 @@ class ArbeitnowScraper(BaseScraper):
     
     def _clean_html(self, text: str) -> str:
         """Remove HTML tags from text."""
-        import re
         if not text:
             return ""
-        clean = re.sub(r'<[^>]+>', '', text)
+        clean = _TAG_RE.sub('', text)
         clean = ' '.join(clean.split())
         return clean.strip()
     
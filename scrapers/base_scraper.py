@@ -5,6 +5,7 @@ All scrapers should inherit from BaseScraper and implement the
 fetch_opportunities() method.
 """
 
+import os
 import logging
 import time
 from abc import ABC, abstractmethod
@@ -13,15 +14,78 @@ from typing import List, Optional, Callable
 from datetime import datetime
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    _json_loads = json.loads
 
 from retry_decorator import with_retry, RetryConfig, RETRYABLE_EXCEPTIONS
 from rate_limiter import RateLimiter, get_rate_limiter
+from response_cache import ResponseCache, conditional_headers, get_response_cache
 from logging_config import get_scraper_logger, log_request
 from data_validator import validate_opportunity, ValidationResult
 from job_filter import passes_all_filters
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_HEADERS = {
+    "User-Agent": "NextStepAI/0.1 (Educational Project)"
+}
+
+# Rows per INSERT statement when saving scraped jobs
+BULK_CREATE_BATCH_SIZE = 500
+
+
+# Environment settings requests honours when Session.trust_env is set
+_HTTP_ENV_VARS = (
+    "HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "NO_PROXY",
+    "REQUESTS_CA_BUNDLE", "CURL_CA_BUNDLE", "NETRC",
+)
+
+
+def _http_env_configured() -> bool:
+    """Check whether proxies, CA bundles or a netrc file are configured."""
+    for var in _HTTP_ENV_VARS:
+        if os.environ.get(var) or os.environ.get(var.lower()):
+            return True
+    return any(
+        os.path.exists(os.path.expanduser(path)) for path in ("~/.netrc", "~/_netrc")
+    )
+
+
+def create_session(pool_connections: int = 10, pool_maxsize: int = 20) -> requests.Session:
+    """
+    Create a keep-alive HTTP session with a pooled connection adapter.
+    
+    Retries are left to with_retry, so the adapter itself never retries.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=0,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(DEFAULT_HEADERS)
+    # With trust_env set, requests re-reads proxy/CA env vars and ~/.netrc on
+    # every call; only pay for that when the environment configures any of them.
+    session.trust_env = _http_env_configured()
+    return session
+
+
+# Shared by all scrapers in the process so repeated runs reuse TCP/TLS connections
+_SESSION = create_session()
+
+
+def decode_json(response: requests.Response):
+    """Decode a JSON response body, using orjson when it is installed."""
+    return _json_loads(response.content)
+
 
 @dataclass
 class OpportunityData:
@@ -60,11 +124,13 @@ class BaseScraper(ABC):
     max_retries: int = 3
     retry_base_delay: float = 1.0  # initial retry delay
     retry_max_delay: float = 60.0  # max retry delay
+    cache_ttl: float = 300.0  # seconds a fetched JSON payload is reused
     
-    def __init__(self):
-        self.headers = {
-            "User-Agent": "NextStepAI/0.1 (Educational Project)"
-        }
+    def __init__(self, session: Optional[requests.Session] = None):
+        self.headers = dict(DEFAULT_HEADERS)
+        # Orchestrated runs pass their own pooled session; standalone runs
+        # share the module-level one
+        self.session = session or _SESSION
         self._last_request_time = 0
         self._retry_count = 0
         self._request_count = 0
@@ -75,9 +141,16 @@ class BaseScraper(ABC):
             base_delay=self.retry_base_delay,
             max_delay=self.retry_max_delay,
         )
+        # Retrying sender built once instead of a decorated closure per request
+        self._send_with_retry = with_retry(
+            max_retries=self.max_retries,
+            base_delay=self.retry_base_delay,
+            max_delay=self.retry_max_delay,
+        )(self._send)
         
         # Initialize rate limiter for this source
         self._rate_limiter = get_rate_limiter(self.source_name)
+        self._response_cache = get_response_cache()
         self._logger = get_scraper_logger(self.source_name)
     
     def _respect_rate_limit(self):
@@ -108,15 +181,10 @@ class BaseScraper(ABC):
         self._respect_rate_limit()
         self._request_count += 1
 
-        @with_retry(
-            max_retries=self.max_retries,
-            base_delay=self.retry_base_delay,
-            max_delay=self.retry_max_delay,
-        )
-        def _execute_request():
-            response = requests.request(
-                method=method,
-                url=url,
+        try:
+            return self._send_with_retry(
+                method,
+                url,
                 params=params,
                 data=data,
                 json=json,
@@ -124,19 +192,53 @@ class BaseScraper(ABC):
                 timeout=timeout,
                 **kwargs
             )
-            if response.status_code == 429:
-                self._rate_limiter.report_429()
-                response.raise_for_status()
-            response.raise_for_status()
-            self._rate_limiter.report_success()
-            return response
-
-        try:
-            return _execute_request()
         except RETRYABLE_EXCEPTIONS as e:
             self._retry_count += 1
             raise
     
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Issue one HTTP request and report the outcome to the rate limiter."""
+        response = self.session.request(method=method, url=url, **kwargs)
+        if response.status_code == 429:
+            self._rate_limiter.report_429()
+        response.raise_for_status()
+        self._rate_limiter.report_success()
+        return response
+    
+    def _get_json(self, url: str, params: dict = None, timeout: int = 15):
+        """
+        GET a JSON endpoint through the shared session.
+        
+        Responses are cached for `cache_ttl` seconds per URL + params, so a
+        repeat run inside that window skips the request (and rate limit).
+        After that, if the server sent an ETag or Last-Modified header, the
+        refetch is conditional and a 304 reuses the cached payload.
+        
+        Raises:
+            requests.RequestException on HTTP failure
+        """
+        key = ResponseCache.make_key(url, params)
+        data = self._response_cache.get(key)
+        if data is not None:
+            self._logger.debug(f"Cache hit for {url}")
+            return data
+        
+        stale = self._response_cache.get_stale(key)
+        headers = {**self.headers, **stale[1]} if stale else self.headers
+        
+        # Same path as every other request: rate limit, retry, 429 backoff
+        response = self._make_request(url, params=params, headers=headers, timeout=timeout)
+        if stale and response.status_code == 304:
+            self._logger.debug(f"Not modified: {url}")
+            self._response_cache.revalidated(key, stale[0], ttl=self.cache_ttl, validators=stale[1])
+            return stale[0]
+        
+        data = decode_json(response)
+        self._response_cache.set(
+            key, data, ttl=self.cache_ttl, validators=conditional_headers(response)
+        )
+        return data
+    
     @abstractmethod
     def fetch_opportunities(self) -> List[OpportunityData]:
         """
@@ -302,7 +404,11 @@ class BaseScraper(ABC):
 
             if jobs_to_create:
                 from core.models import Job
-                created = Job.objects.bulk_create(jobs_to_create, ignore_conflicts=True)
+                created = Job.objects.bulk_create(
+                    jobs_to_create,
+                    batch_size=BULK_CREATE_BATCH_SIZE,
+                    ignore_conflicts=True,
+                )
                 stats["saved"] = len(created)
                 stats["duplicates"] = len(jobs_to_create) - len(created)
                 # Adjust filtered count: subtract true duplicates from the bucket
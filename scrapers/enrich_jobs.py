@@ -84,7 +84,7 @@ def enrich_jobs(limit: int = None, dry_run: bool = False, reset: bool = False):
     
     success = 0
     failed = 0
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     for i, job in enumerate(jobs, 1):
         if dry_run:
@@ -144,13 +144,13 @@ def enrich_jobs(limit: int = None, dry_run: bool = False, reset: bool = False):
             logger.error(f"  ✗ [{i}] Error: {e}")
     
     # Summary
-    duration = round(time.time() - start_time, 2)
-    jobs_per_sec = round(len(jobs) / max(duration, 0.01), 1)
+    duration = time.perf_counter() - start_time
+    jobs_per_sec = len(jobs) / max(duration, 0.01)
     
     logger.info("=" * 50)
     logger.info("ENRICHMENT COMPLETE")
     logger.info("=" * 50)
-    logger.info(f"Processed: {len(jobs)} jobs in {duration}s ({jobs_per_sec} jobs/sec)")
+    logger.info(f"Processed: {len(jobs)} jobs in {duration:.2f}s ({jobs_per_sec:.1f} jobs/sec)")
     logger.info(f"Success: {success}")
     logger.info(f"Failed: {failed}")
     
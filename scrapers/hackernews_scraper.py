@@ -10,6 +10,7 @@ import sys
 import re
 import logging
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 from datetime import datetime
 from bs4 import BeautifulSoup
@@ -41,8 +42,16 @@ class HackerNewsScraper(BaseScraper):
     INTERNSHIP_KEYWORDS = ['intern', 'internship', 'student', 'junior', 'entry level', 'graduate']
     FREELANCE_KEYWORDS = ['freelance', 'contract', 'contractor', 'part-time', 'consultant']
     
-    def __init__(self, max_comments: int = 100, filter_remote_india: bool = True):
-        super().__init__()
+    # Upper bound on concurrent comment requests
+    MAX_COMMENT_WORKERS = 8
+    
+    def __init__(
+        self,
+        max_comments: int = 100,
+        filter_remote_india: bool = True,
+        session: Optional[requests.Session] = None,
+    ):
+        super().__init__(session=session)
         self.max_comments = max_comments
         self.filter_remote_india = filter_remote_india
         self.api_base = "https://hacker-news.firebaseio.com/v0"
@@ -52,7 +61,7 @@ class HackerNewsScraper(BaseScraper):
         try:
             # Search for hiring threads by user "whoishiring"
             user_url = f"{self.api_base}/user/whoishiring.json"
-            response = requests.get(user_url, timeout=10)
+            response = self.session.get(user_url, timeout=10)
             response.raise_for_status()
             
             user_data = response.json()
@@ -62,7 +71,7 @@ class HackerNewsScraper(BaseScraper):
             for item_id in submitted[:10]:
                 self._respect_rate_limit()
                 item_url = f"{self.api_base}/item/{item_id}.json"
-                item_resp = requests.get(item_url, timeout=10)
+                item_resp = self.session.get(item_url, timeout=10)
                 item = item_resp.json()
                 
                 if item and 'who is hiring' in item.get('title', '').lower():
@@ -126,6 +135,46 @@ class HackerNewsScraper(BaseScraper):
         
         return has_remote or has_india
     
+    def _fetch_comment(self, comment_id: int) -> Optional[OpportunityData]:
+        """Fetch one top-level comment and parse it into an opportunity."""
+        try:
+            self._respect_rate_limit()
+            
+            comment_url = f"{self.api_base}/item/{comment_id}.json"
+            comment_resp = self.session.get(comment_url, timeout=10)
+            comment = comment_resp.json()
+            
+            if not comment or comment.get('deleted') or comment.get('dead'):
+                return None
+            
+            text = comment.get('text', '')
+            if not text or len(text) < 50:
+                return None
+            
+            # Check relevance
+            if not self._is_relevant(text):
+                return None
+            
+            # Parse the posting
+            parsed = self._parse_job_posting(text)
+            
+            # Clean HTML from description
+            clean_text = BeautifulSoup(text, 'lxml').get_text()
+            
+            return OpportunityData(
+                title=parsed['title'][:255],
+                company=parsed['company'][:255],
+                description=clean_text[:5000],
+                job_type=parsed['job_type'],
+                apply_link=f"https://news.ycombinator.com/item?id={comment_id}",
+                location=parsed['location'],
+                source=self.source_name,
+            )
+            
+        except Exception as e:
+            logger.warning(f"Error processing comment {comment_id}: {e}")
+            return None
+    
     def fetch_opportunities(self) -> List[OpportunityData]:
         """Fetch job postings from HN hiring thread."""
         opportunities = []
@@ -139,50 +188,17 @@ class HackerNewsScraper(BaseScraper):
         try:
             # Get thread details
             thread_url = f"{self.api_base}/item/{thread_id}.json"
-            response = requests.get(thread_url, timeout=10)
+            response = self.session.get(thread_url, timeout=10)
             thread = response.json()
             
             kids = thread.get('kids', [])[:self.max_comments]
             logger.info(f"Processing {len(kids)} comments from thread {thread_id}")
             
-            for comment_id in kids:
-                try:
-                    self._respect_rate_limit()
-                    
-                    comment_url = f"{self.api_base}/item/{comment_id}.json"
-                    comment_resp = requests.get(comment_url, timeout=10)
-                    comment = comment_resp.json()
-                    
-                    if not comment or comment.get('deleted') or comment.get('dead'):
-                        continue
-                    
-                    text = comment.get('text', '')
-                    if not text or len(text) < 50:
-                        continue
-                    
-                    # Check relevance
-                    if not self._is_relevant(text):
-                        continue
-                    
-                    # Parse the posting
-                    parsed = self._parse_job_posting(text)
-                    
-                    # Clean HTML from description
-                    clean_text = BeautifulSoup(text, 'lxml').get_text()
-                    
-                    opportunity = OpportunityData(
-                        title=parsed['title'][:255],
-                        company=parsed['company'][:255],
-                        description=clean_text[:5000],
-                        job_type=parsed['job_type'],
-                        apply_link=f"https://news.ycombinator.com/item?id={comment_id}",
-                        location=parsed['location'],
-                        source=self.source_name,
-                    )
-                    opportunities.append(opportunity)
-                    
-                except Exception as e:
-                    logger.warning(f"Error processing comment {comment_id}: {e}")
+            # Comment fetches are independent; overlap their network waits
+            with ThreadPoolExecutor(max_workers=self.MAX_COMMENT_WORKERS) as pool:
+                for opportunity in pool.map(self._fetch_comment, kids):
+                    if opportunity is not None:
+                        opportunities.append(opportunity)
             
         except Exception as e:
             logger.error(f"Error fetching thread: {e}")
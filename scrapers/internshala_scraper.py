@@ -10,7 +10,7 @@ import os
 import sys
 import logging
 import requests
-from typing import List
+from typing import List, Optional
 from bs4 import BeautifulSoup
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -42,8 +42,13 @@ class InternshalaScraper(BaseScraper):
         "graphic-design-internship",
     ]
 
-    def __init__(self, categories: List[str] = None, max_per_category: int = 15):
-        super().__init__()
+    def __init__(
+        self,
+        categories: List[str] = None,
+        max_per_category: int = 15,
+        session: Optional[requests.Session] = None,
+    ):
+        super().__init__(session=session)
         self.categories = categories or self.CATEGORIES
         self.max_per_category = max_per_category
         self.base_url = "https://internshala.com"
@@ -60,7 +65,7 @@ class InternshalaScraper(BaseScraper):
             try:
                 self._respect_rate_limit()
                 url = f"{self.base_url}/internships/{category}"
-                response = requests.get(url, headers=self.headers, timeout=20)
+                response = self.session.get(url, headers=self.headers, timeout=20)
                 response.raise_for_status()
 
                 soup = BeautifulSoup(response.text, 'lxml')
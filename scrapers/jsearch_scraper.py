@@ -14,7 +14,7 @@ import os
 import sys
 import logging
 import requests
-from typing import List
+from typing import List, Optional
 
 # Setup Django
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -76,8 +76,13 @@ class JSearchScraper(BaseScraper):
         "INTERN": "internship",
     }
 
-    def __init__(self, queries: List[str] = None, limit: int = 50):
-        super().__init__()
+    def __init__(
+        self,
+        queries: List[str] = None,
+        limit: int = 50,
+        session: Optional[requests.Session] = None,
+    ):
+        super().__init__(session=session)
         self.api_key = os.environ.get("JSEARCH_API_KEY", "")
         self.queries = queries or self.DEFAULT_QUERIES
         self.limit = limit  # Max total jobs to fetch across all queries
@@ -183,7 +188,7 @@ class JSearchScraper(BaseScraper):
         }
 
         try:
-            response = requests.get(
+            response = self.session.get(
                 self.API_URL,
                 headers=self._get_headers(),
                 params=params,
@@ -7,6 +7,7 @@ and per-scraper log files.
 
 import os
 import sys
+import json
 import logging
 import logging.handlers
 from datetime import datetime
@@ -35,6 +36,27 @@ class ColoredFormatter(logging.Formatter):
         return super().format(record)
 
 
+class JsonFormatter(logging.Formatter):
+    """Formatter that renders each record as one JSON object per line."""
+    
+    # Attributes every LogRecord has; anything else came from `extra=`
+    RESERVED = frozenset(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+    
+    def format(self, record):
+        payload = {
+            'time': self.formatTime(record, self.datefmt),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in self.RESERVED:
+                payload[key] = value
+        if record.exc_info:
+            payload['exc_info'] = self.formatException(record.exc_info)
+        return json.dumps(payload, default=str)
+
+
 def setup_logging(
     level: int = logging.INFO,
     log_to_file: bool = True,
@@ -71,13 +93,20 @@ def setup_logging(
     file_format = '%(asctime)s | %(levelname)-8s | %(name)-20s | %(message)s'
     date_format = '%Y-%m-%d %H:%M:%S'
     
+    def file_formatter():
+        if json_format:
+            return JsonFormatter(datefmt=date_format)
+        return logging.Formatter(file_format, datefmt=date_format)
+    
     # Console handler
     if log_to_console:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(level)
         
         # Use colored formatter if terminal supports it
-        if sys.stdout.isatty():
+        if json_format:
+            formatter = JsonFormatter(datefmt=date_format)
+        elif sys.stdout.isatty():
             formatter = ColoredFormatter(console_format, datefmt=date_format)
         else:
             formatter = logging.Formatter(console_format, datefmt=date_format)
@@ -96,7 +125,7 @@ def setup_logging(
             encoding='utf-8',
         )
         file_handler.setLevel(level)
-        file_handler.setFormatter(logging.Formatter(file_format, datefmt=date_format))
+        file_handler.setFormatter(file_formatter())
         root_logger.addHandler(file_handler)
         
         # Error-only log file
@@ -108,7 +137,7 @@ def setup_logging(
             encoding='utf-8',
         )
         error_handler.setLevel(logging.ERROR)
-        error_handler.setFormatter(logging.Formatter(file_format, datefmt=date_format))
+        error_handler.setFormatter(file_formatter())
         root_logger.addHandler(error_handler)
         
         # Source-specific log file
@@ -121,7 +150,7 @@ def setup_logging(
                 encoding='utf-8',
             )
             source_handler.setLevel(level)
-            source_handler.setFormatter(logging.Formatter(file_format, datefmt=date_format))
+            source_handler.setFormatter(file_formatter())
             
             # Only log messages from this source
             source_handler.addFilter(lambda r: source_name in r.name or r.name == 'root')
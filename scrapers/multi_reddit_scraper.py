@@ -10,7 +10,7 @@ import sys
 import logging
 import requests
 import requests.auth
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 # Setup Django
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -83,9 +83,10 @@ class MultiRedditScraper(BaseScraper):
         self, 
         subreddits: List[str] = None, 
         limit_per_sub: int = 25,
-        filter_india_remote: bool = True
+        filter_india_remote: bool = True,
+        session: Optional[requests.Session] = None,
     ):
-        super().__init__()
+        super().__init__(session=session)
         self.subreddits = subreddits or list(self.SUBREDDITS.keys())
         self.limit_per_sub = limit_per_sub
         self.filter_india_remote = filter_india_remote
@@ -97,7 +98,7 @@ class MultiRedditScraper(BaseScraper):
         if not client_id or not client_secret:
             return ""
         try:
-            resp = requests.post(
+            resp = self.session.post(
                 "https://www.reddit.com/api/v1/access_token",
                 auth=requests.auth.HTTPBasicAuth(client_id, client_secret),
                 data={"grant_type": "client_credentials"},
@@ -163,7 +164,7 @@ class MultiRedditScraper(BaseScraper):
             else:
                 url = f"https://www.reddit.com/r/{subreddit}/new.json?limit={self.limit_per_sub}"
                 headers = self.headers
-            response = requests.get(url, headers=headers, timeout=15)
+            response = self.session.get(url, headers=headers, timeout=15)
             response.raise_for_status()
             
             data = response.json()
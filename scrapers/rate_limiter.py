@@ -76,12 +76,12 @@ class TokenBucket:
         self.tokens_per_second = tokens_per_second
         self.max_tokens = max_tokens
         self.tokens = max_tokens
-        self.last_update = time.time()
+        self.last_update = time.monotonic()
         self._lock = threading.Lock()
     
     def _refill(self):
         """Add tokens based on time elapsed."""
-        now = time.time()
+        now = time.monotonic()
         elapsed = now - self.last_update
         self.tokens = min(
             self.max_tokens,
@@ -91,10 +91,13 @@ class TokenBucket:
     
     def acquire(self, tokens: int = 1) -> float:
         """
-        Acquire tokens, blocking if necessary.
+        Reserve tokens, going into debt if the bucket is short.
+        
+        The caller must wait the returned time before using the tokens;
+        later callers see the debt and wait correspondingly longer.
         
         Returns:
-            Time waited in seconds
+            Time to wait in seconds
         """
         with self._lock:
             self._refill()
@@ -103,9 +106,10 @@ class TokenBucket:
                 self.tokens -= tokens
                 return 0.0
             
-            # Calculate wait time
+            # Calculate wait time and reserve the tokens up front
             tokens_needed = tokens - self.tokens
             wait_time = tokens_needed / self.tokens_per_second
+            self.tokens -= tokens
             
             return wait_time
     
@@ -150,33 +154,30 @@ class RateLimiter:
         """
         Wait for rate limit, then return.
         
+        Each caller reserves the next free request slot under the lock and
+        sleeps outside it, so concurrent callers sharing this limiter are
+        spaced out correctly without serializing on the lock.
+        
         Returns:
             Time waited in seconds
         """
         with self._lock:
-            wait_time = 0.0
+            now = time.monotonic()
             
-            # Check token bucket
+            # Earliest start allowed by the token bucket and the minimum delay
             bucket_wait = self._bucket.acquire()
-            if bucket_wait > 0:
-                time.sleep(bucket_wait)
-                wait_time += bucket_wait
+            start = max(now + bucket_wait, self._last_request_time + self._current_delay)
+            wait_time = start - now
             
-            # Enforce minimum delay between requests
-            elapsed = time.time() - self._last_request_time
-            if elapsed < self._current_delay:
-                sleep_time = self._current_delay - elapsed
-                time.sleep(sleep_time)
-                wait_time += sleep_time
-            
-            self._last_request_time = time.time()
+            self._last_request_time = start
             self._request_count += 1
             self._total_wait_time += wait_time
-            
-            if wait_time > 0:
-                logger.debug(f"[{self.source}] Rate limited, waited {wait_time:.2f}s")
-            
-            return wait_time
+        
+        if wait_time > 0:
+            time.sleep(wait_time)
+            logger.debug(f"[{self.source}] Rate limited, waited {wait_time:.2f}s")
+        
+        return wait_time
     
     def report_429(self):
         """Report a 429 (rate limited) response to increase delay."""
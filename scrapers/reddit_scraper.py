@@ -5,10 +5,11 @@ Fetches job postings from r/forhire using Reddit's public JSON API.
 """
 
 import os
+import re
 import sys
 import logging
 import requests
-from typing import List
+from typing import List, Optional
 
 # Setup Django before importing models
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -24,6 +25,19 @@ from base_scraper import BaseScraper, OpportunityData
 
 logger = logging.getLogger(__name__)
 
+# One pass over a [Hiring] title picks up all remote/on-site hints
+_LOCATION_RE = re.compile(r'remote|local|on-?site|in-person', re.I)
+
+ONSITE_INDICATORS = frozenset({"local", "on-site", "onsite", "in-person"})
+
+# Reddit posts carry dozens of fields; only these are kept as raw_data
+RAW_DATA_FIELDS = ("id", "name", "author", "subreddit", "created_utc", "link_flair_text", "permalink")
+
+
+def _keyword_pattern(keywords) -> re.Pattern:
+    """Compile a keyword list into one case-insensitive substring matcher."""
+    return re.compile("|".join(map(re.escape, keywords)), re.I)
+
 
 class RedditForHireScraper(BaseScraper):
     """Scraper for Reddit r/forhire subreddit."""
@@ -42,68 +56,80 @@ class RedditForHireScraper(BaseScraper):
         "contractor", "hourly"
     ]
     
+    # Each keyword list compiled once into a single-pass matcher
+    _INTERNSHIP_RE = _keyword_pattern(INTERNSHIP_KEYWORDS)
+    _FREELANCE_RE = _keyword_pattern(FREELANCE_KEYWORDS)
+    
     HIRING_FLAIR = "[Hiring]"  # Posts from employers
     
-    def __init__(self, subreddit: str = "forhire", limit: int = 50):
-        super().__init__()
+    def __init__(
+        self,
+        subreddit: str = "forhire",
+        limit: int = 50,
+        session: Optional[requests.Session] = None,
+    ):
+        super().__init__(session=session)
         self.subreddit = subreddit
         self.limit = limit
         self.api_url = f"https://www.reddit.com/r/{subreddit}/new.json?limit={limit}"
     
     def _detect_job_type(self, text: str) -> str:
         """Detect job type from post content."""
-        text_lower = text.lower()
-        
-        if any(kw in text_lower for kw in self.INTERNSHIP_KEYWORDS):
+        if self._INTERNSHIP_RE.search(text):
             return "internship"
-        if any(kw in text_lower for kw in self.FREELANCE_KEYWORDS):
+        if self._FREELANCE_RE.search(text):
             return "freelance"
         
         return "job"
     
+    def _location_indicators(self, title: str) -> set:
+        """Return the lowercased location indicators found in a title."""
+        return {m.group(0).lower() for m in _LOCATION_RE.finditer(title)}
+    
     def _is_hiring_post(self, title: str) -> bool:
         """Check if this is a [Hiring] post (employer posting a job)."""
-        return self.HIRING_FLAIR.lower() in title.lower()
+        # Common spellings first; only odd casings pay for a lowercased copy
+        return (
+            self.HIRING_FLAIR in title
+            or "[HIRING]" in title
+            or "[hiring]" in title
+            or "[hiring]" in title.casefold()
+        )
+    
+    def _minify(self, post_data: dict) -> dict:
+        """Keep only the identifying fields of a post for raw_data."""
+        return {key: post_data[key] for key in RAW_DATA_FIELDS if key in post_data}
     
     def fetch_opportunities(self) -> List[OpportunityData]:
         """Fetch hiring posts from r/forhire."""
         opportunities = []
         
         try:
-            self._respect_rate_limit()
-            response = requests.get(
-                self.api_url, 
-                headers=self.headers, 
-                timeout=10
-            )
-            response.raise_for_status()
-            
-            data = response.json()
+            data = self._get_json(self.api_url, timeout=10)
             posts = data.get("data", {}).get("children", [])
+            is_hiring_post = self._is_hiring_post
             
             for post in posts:
                 post_data = post.get("data", {})
-                title = post_data.get("title", "")
+                field = post_data.get  # bound once, reused for every field
+                title = field("title", "")
                 
-                # Only process [Hiring] posts
-                if not self._is_hiring_post(title):
+                # Only process [Hiring] posts; most posts stop here
+                if not is_hiring_post(title):
                     continue
                 
-                selftext = post_data.get("selftext", "")
-                permalink = post_data.get("permalink", "")
+                selftext = field("selftext", "")
+                permalink = field("permalink", "")
                 
                 # Detect job type from content
                 content = f"{title} {selftext}"
                 job_type = self._detect_job_type(content)
                 
                 # Extract location from title if mentioned
+                indicators = self._location_indicators(title)
                 location = "Remote"  # Default
-                if "remote" not in title.lower():
-                    # Try to extract location indicators
-                    for indicator in ["local", "on-site", "onsite", "in-person"]:
-                        if indicator in title.lower():
-                            location = "On-site (see description)"
-                            break
+                if "remote" not in indicators and indicators & ONSITE_INDICATORS:
+                    location = "On-site (see description)"
                 
                 opportunity = OpportunityData(
                     title=title.replace(self.HIRING_FLAIR, "").strip()[:255],
@@ -113,7 +139,7 @@ class RedditForHireScraper(BaseScraper):
                     apply_link=f"https://www.reddit.com{permalink}",
                     location=location,
                     source=self.source_name,
-                    raw_data=post_data
+                    raw_data=self._minify(post_data)
                 )
                 opportunities.append(opportunity)
             
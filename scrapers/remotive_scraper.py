@@ -6,11 +6,22 @@ Great source for remote-first opportunities.
 """
 
 import os
+import re
 import sys
 import logging
 import requests
-from typing import List
-from bs4 import BeautifulSoup
+from html import unescape
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Optional
+
+import lxml.html
+from lxml import etree
+from lxml.etree import ParserError
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 # Setup Django
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -23,9 +34,37 @@ import django
 django.setup()
 
 from base_scraper import BaseScraper, OpportunityData
+from response_cache import ResponseCache, conditional_headers
 
 logger = logging.getLogger(__name__)
 
+_NON_LETTERS_RE = re.compile(r'[^a-z]+')
+
+# Elements whose text is never shown, and a regex fallback for markup
+_INVISIBLE_TAGS = ('script', 'style')
+_MARKUP_RE = re.compile(r'<(script|style)\b.*?</\1\s*>|<!--.*?-->|<[^>]*>', re.S | re.I)
+
+
+def _words(text: str) -> set:
+    """Split lowercased text into a set of alphabetic words."""
+    return set(_NON_LETTERS_RE.split(text))
+
+
+def _html_to_text(html: str) -> str:
+    """Extract the visible text of an HTML fragment (script/style dropped)."""
+    if not html or html.isspace():
+        return ''
+    try:
+        doc = lxml.html.fromstring(html)
+    except (ParserError, ValueError):
+        # Comment-only input, or an XML encoding declaration lxml rejects
+        # on str input; strip the markup instead of storing it
+        return unescape(_MARKUP_RE.sub('', html))
+    if doc.tag in _INVISIBLE_TAGS:
+        return ''
+    etree.strip_elements(doc, *_INVISIBLE_TAGS, with_tail=False)
+    return doc.text_content()
+
 
 class RemotiveScraper(BaseScraper):
     """Scraper for Remotive.io remote jobs."""
@@ -43,27 +82,42 @@ class RemotiveScraper(BaseScraper):
         'all-others'
     ]
     
-    # Keywords for internships/entry level
-    ENTRY_KEYWORDS = ['intern', 'junior', 'entry', 'graduate', 'trainee', 'apprentice']
-    FREELANCE_KEYWORDS = ['freelance', 'contract', 'contractor', 'part-time']
+    # Whole-word keywords for internships/entry level
+    ENTRY_KEYWORDS = frozenset({
+        'intern', 'interns', 'internship', 'internships', 'junior', 'entry',
+        'graduate', 'graduates', 'trainee', 'trainees', 'apprentice', 'apprenticeship',
+    })
+    FREELANCE_KEYWORDS = frozenset({'freelance', 'freelancer', 'contract', 'contractor'})
+    
+    # Whole-word locations that count as India-friendly
+    INDIA_KEYWORDS = frozenset({'india', 'worldwide', 'anywhere', 'global', 'asia', 'apac'})
+    
+    # Upper bound on concurrent category requests
+    MAX_CATEGORY_WORKERS = 6
     
-    def __init__(self, category: str = None, limit: int = 50):
-        super().__init__()
+    def __init__(
+        self,
+        category: str = None,
+        limit: int = 50,
+        categories: List[str] = None,
+        session: Optional[requests.Session] = None,
+    ):
+        super().__init__(session=session)
         self.category = category
+        self.categories = categories  # fetched concurrently, `limit` jobs each
         self.limit = limit
         self.api_url = "https://remotive.com/api/remote-jobs"
     
-    def _detect_job_type(self, job: dict) -> str:
-        """Detect if job is internship, freelance, or regular."""
-        title = job.get('title', '').lower()
-        job_type_raw = job.get('job_type', '').lower()
+    def _detect_job_type(self, title: str, job_type_raw: str) -> str:
+        """Detect if job is internship, freelance, or regular (expects lowercased input)."""
+        title_words = _words(title)
         
         # Check for internship
-        if any(kw in title for kw in self.ENTRY_KEYWORDS):
+        if title_words & self.ENTRY_KEYWORDS:
             return 'internship'
         
         # Check for freelance/contract
-        if 'contract' in job_type_raw or any(kw in title for kw in self.FREELANCE_KEYWORDS):
+        if 'contract' in job_type_raw or title_words & self.FREELANCE_KEYWORDS or 'part-time' in title:
             return 'freelance'
         
         if 'part_time' in job_type_raw or 'part-time' in job_type_raw:
@@ -71,76 +125,136 @@ class RemotiveScraper(BaseScraper):
         
         return 'job'
     
-    def _is_india_friendly(self, job: dict) -> bool:
-        """Check if job mentions India or is truly worldwide."""
-        candidate_location = job.get('candidate_required_location', '').lower()
+    def _is_india_friendly(self, candidate_location: str) -> bool:
+        """Check if a lowercased location mentions India or is truly worldwide."""
+        # If no location restriction or mentions India-friendly regions
+        return not candidate_location or bool(_words(candidate_location) & self.INDIA_KEYWORDS)
+    
+    def _fetch_category(self, category: str = None) -> List[dict]:
+        """Fetch the raw job list for one category (or all jobs if None)."""
+        params = {'limit': self.limit}
+        if category:
+            params['category'] = category
         
-        india_keywords = ['india', 'worldwide', 'anywhere', 'global', 'asia', 'apac']
+        if ijson is not None:
+            data = self._stream_jobs(params)
+        else:
+            data = self._get_json(self.api_url, params=params, timeout=15)
+        return data.get('jobs', [])
+    
+    def _stream_jobs(self, params: dict) -> dict:
+        """
+        Stream-parse the jobs array with ijson, keeping only India-friendly jobs.
         
-        # If no location restriction or mentions India-friendly regions
-        if not candidate_location or any(kw in candidate_location for kw in india_keywords):
-            return True
+        Rejected jobs are dropped as they are parsed instead of after the
+        whole payload has been materialized. The request goes through
+        _make_request (rate limit + retry) and is cached and revalidated
+        like _get_json, under its own key since the payload is filtered.
+        """
+        key = ResponseCache.make_key(self.api_url, params) + ('stream',)
+        data = self._response_cache.get(key)
+        if data is not None:
+            return data
         
-        return False
+        stale = self._response_cache.get_stale(key)
+        headers = {**self.headers, **stale[1]} if stale else self.headers
+        response = self._make_request(
+            self.api_url, params=params, headers=headers, timeout=15, stream=True
+        )
+        try:
+            if stale and response.status_code == 304:
+                self._response_cache.revalidated(key, stale[0], ttl=self.cache_ttl, validators=stale[1])
+                return stale[0]
+            response.raw.decode_content = True
+            jobs = [
+                job for job in ijson.items(response.raw, 'jobs.item', use_float=True)
+                if self._is_india_friendly((job.get('candidate_required_location') or '').lower())
+            ]
+        finally:
+            response.close()
+        
+        data = {'jobs': jobs}
+        self._response_cache.set(
+            key, data, ttl=self.cache_ttl, validators=conditional_headers(response)
+        )
+        return data
+    
+    def _to_opportunity(self, job: dict) -> Optional[OpportunityData]:
+        """Convert one raw Remotive job, or return None if it is not India-friendly."""
+        candidate_location = job.get('candidate_required_location') or ''
+        
+        # Filter for India-friendly locations
+        if not self._is_india_friendly(candidate_location.lower()):
+            return None
+        
+        job_type = self._detect_job_type(
+            (job.get('title') or '').lower(),
+            (job.get('job_type') or '').lower(),
+        )
+        
+        # Clean HTML, then prefix salary onto the already-truncated text
+        clean_desc = _html_to_text(job.get('description', ''))[:10000]
+        salary = job.get('salary', '')
+        if salary:
+            clean_desc = f"Salary: {salary}\n\n{clean_desc}"[:10000]
+        
+        if 'candidate_required_location' not in job:
+            location = 'Remote (Worldwide)'
+        else:
+            location = candidate_location or 'Remote'
+        
+        return OpportunityData(
+            title=job.get('title', 'Remote Position')[:255],
+            company=job.get('company_name', 'Company')[:255],
+            description=clean_desc,
+            job_type=job_type,
+            apply_link=job.get('url', 'https://remotive.com'),
+            location=f"Remote - {location}"[:255],
+            source=self.source_name,
+            raw_data={
+                'category': job.get('category'),
+                'tags': job.get('tags', []),
+                'publication_date': job.get('publication_date'),
+            }
+        )
+    
+    def _scrape_category(self, category: str = None) -> List[OpportunityData]:
+        """Fetch one category and convert its jobs on the calling thread."""
+        opportunities = []
+        for job in self._fetch_category(category):
+            opportunity = self._to_opportunity(job)
+            if opportunity is not None:
+                opportunities.append(opportunity)
+        return opportunities
+    
+    def _scrape_all(self) -> List[OpportunityData]:
+        """
+        Scrape all requested categories.
+        
+        With several categories each worker thread fetches and converts its
+        own jobs, so HTML extraction overlaps the other in-flight requests.
+        """
+        if not self.categories:
+            return self._scrape_category(self.category)
+        
+        opportunities = []
+        workers = min(self.MAX_CATEGORY_WORKERS, len(self.categories))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(self._scrape_category, cat): cat for cat in self.categories}
+            for future in as_completed(futures):
+                # A failed request or malformed body only loses its own category
+                try:
+                    opportunities.extend(future.result())
+                except Exception as e:
+                    logger.error(f"Error fetching Remotive category {futures[future]}: {e}")
+        return opportunities
     
     def fetch_opportunities(self) -> List[OpportunityData]:
         """Fetch remote jobs from Remotive API."""
         opportunities = []
         
         try:
-            self._respect_rate_limit()
-            
-            params = {'limit': self.limit}
-            if self.category:
-                params['category'] = self.category
-            
-            response = requests.get(
-                self.api_url,
-                params=params,
-                headers=self.headers,
-                timeout=15
-            )
-            response.raise_for_status()
-            
-            data = response.json()
-            jobs = data.get('jobs', [])
-            
-            for job in jobs:
-                # Filter for India-friendly locations
-                if not self._is_india_friendly(job):
-                    continue
-                
-                job_type = self._detect_job_type(job)
-                
-                # Build description
-                description = job.get('description', '')
-                salary = job.get('salary', '')
-                if salary:
-                    description = f"Salary: {salary}\n\n{description}"
-                
-                # Clean HTML
-                clean_desc = BeautifulSoup(description, 'lxml').get_text()
-                
-                location = job.get('candidate_required_location', 'Remote (Worldwide)')
-                if not location:
-                    location = 'Remote'
-                
-                opportunity = OpportunityData(
-                    title=job.get('title', 'Remote Position')[:255],
-                    company=job.get('company_name', 'Company')[:255],
-                    description=clean_desc[:10000],
-                    job_type=job_type,
-                    apply_link=job.get('url', 'https://remotive.com'),
-                    location=f"Remote - {location}"[:255],
-                    source=self.source_name,
-                    raw_data={
-                        'category': job.get('category'),
-                        'tags': job.get('tags', []),
-                        'publication_date': job.get('publication_date'),
-                    }
-                )
-                opportunities.append(opportunity)
-            
+            opportunities = self._scrape_all()
             logger.info(f"Fetched {len(opportunities)} India-friendly remote jobs")
             
         except requests.exceptions.RequestException as e:
@@ -0,0 +1,132 @@
+"""
+Response cache for NextStep AI scrapers.
+
+Keeps decoded API payloads in memory for a short TTL, keyed by URL and
+query params, so repeated scheduled runs inside the window skip the
+HTTP round-trip entirely. Entries stored with ETag / Last-Modified
+validators are kept past their TTL so the next fetch can be a
+conditional request; a 304 reply then reuses the cached payload.
+"""
+
+import time
+import threading
+import logging
+from typing import Any, Dict, Optional, Tuple
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+# Default time-to-live for cached responses (seconds)
+DEFAULT_TTL = 300.0
+
+
+class ResponseCache:
+    """
+    Thread-safe in-memory TTL cache.
+
+    Entries expire `ttl` seconds after they are stored and are evicted
+    lazily on the next lookup, unless they carry revalidation headers.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_TTL):
+        self.ttl = ttl
+        self._entries: Dict[tuple, Tuple[float, Any, dict]] = {}
+        self._hits = 0
+        self._misses = 0
+        self._revalidated = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(url: str, params: Optional[dict] = None) -> tuple:
+        """Build a hashable cache key from a URL and its query params."""
+        return (url, tuple(sorted((params or {}).items())))
+
+    def get(self, key: tuple) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._hits += 1
+                return entry[1]
+            if entry is not None and not entry[2]:
+                del self._entries[key]
+            self._misses += 1
+            return None
+
+    def get_stale(self, key: tuple) -> Optional[Tuple[Any, dict]]:
+        """
+        Return (value, conditional request headers) for an expired entry
+        that can be revalidated, or None.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or not entry[2]:
+                return None
+            return entry[1], entry[2]
+
+    def set(
+        self,
+        key: tuple,
+        value: Any,
+        ttl: Optional[float] = None,
+        validators: Optional[dict] = None,
+    ):
+        """
+        Store value under key for ttl seconds (default: cache TTL).
+
+        validators are the conditional request headers (If-None-Match,
+        If-Modified-Since) to send once the entry has expired.
+        """
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries[key] = (expires_at, value, validators or {})
+
+    def revalidated(
+        self,
+        key: tuple,
+        value: Any,
+        ttl: Optional[float] = None,
+        validators: Optional[dict] = None,
+    ):
+        """Re-store a stale value after the server answered 304 Not Modified."""
+        self.set(key, value, ttl=ttl, validators=validators)
+        with self._lock:
+            self._revalidated += 1
+
+    def clear(self):
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
+        logger.info("Response cache cleared")
+
+    def get_stats(self) -> dict:
+        """Get cache statistics."""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'hits': self._hits,
+                'misses': self._misses,
+                'revalidated': self._revalidated,
+            }
+
+
+def conditional_headers(response: requests.Response) -> dict:
+    """Build If-None-Match / If-Modified-Since headers from a response."""
+    headers = {}
+    etag = response.headers.get('ETag')
+    if etag:
+        headers['If-None-Match'] = etag
+    last_modified = response.headers.get('Last-Modified')
+    if last_modified:
+        headers['If-Modified-Since'] = last_modified
+    return headers
+
+
+_response_cache = ResponseCache()
+
+
+# Convenience function
+def get_response_cache() -> ResponseCache:
+    """Get the process-wide response cache."""
+    return _response_cache
@@ -60,8 +60,15 @@ def with_retry(
         def fetch_data():
             return requests.get(url)
     """
-    if retryable_exceptions is None:
-        retryable_exceptions = RETRYABLE_EXCEPTIONS
+    # Frozen once per decorator; `except` needs a tuple, not a list
+    retryable_exceptions = tuple(
+        RETRYABLE_EXCEPTIONS if retryable_exceptions is None else retryable_exceptions
+    )
+    
+    # The default base of 2 doubles the delay, which is a plain bit shift
+    doubling = exponential_base == 2.0
+    _rand = random.random
+    _sleep = time.sleep
     
     def decorator(func: Callable):
         @functools.wraps(func)
@@ -83,18 +90,21 @@ def with_retry(
                         raise
                     
                     # Calculate delay with exponential backoff
-                    delay = min(base_delay * (exponential_base ** attempt), max_delay)
+                    if doubling:
+                        delay = min(base_delay * (1 << attempt), max_delay)
+                    else:
+                        delay = min(base_delay * (exponential_base ** attempt), max_delay)
                     
                     # Add jitter (±25% of delay)
                     if jitter:
-                        delay = delay * (0.75 + random.random() * 0.5)
+                        delay = delay * (0.75 + _rand() * 0.5)
                     
                     logger.warning(
                         f"Attempt {attempt + 1}/{max_retries + 1} for {func.__name__} failed: {e}. "
                         f"Retrying in {delay:.2f}s..."
                     )
                     
-                    time.sleep(delay)
+                    _sleep(delay)
             
             # Should never reach here, but just in case
             if last_exception:
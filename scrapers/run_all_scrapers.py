@@ -14,15 +14,22 @@ Usage:
     python run_all_scrapers.py --source=X   # Run specific scraper
     python run_all_scrapers.py --scheduled  # Run with scheduler (continuous)
     python run_all_scrapers.py --interval=60  # Run every 60 minutes
+    python run_all_scrapers.py --no-parallel  # Run scrapers one at a time
+    python run_all_scrapers.py --force-rescrape  # Ignore cached API responses
+    SCRAPER_LOG_FORMAT=json python run_all_scrapers.py  # JSON log lines
 """
 
 import os
 import sys
 import argparse
+import functools
+import importlib
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Dict, List, Optional, Set
-from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional
+from dataclasses import asdict, dataclass, field
 
 # Setup Django
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -36,8 +43,11 @@ import django
 django.setup()
 
 # Setup logging BEFORE importing scrapers
-from logging_config import setup_logging, get_scraper_logger
-setup_logging(log_to_file=True)
+from logging_config import LOG_DIR, setup_logging, get_scraper_logger
+setup_logging(
+    log_to_file=True,
+    json_format=os.environ.get('SCRAPER_LOG_FORMAT', '').lower() == 'json',
+)
 
 import logging
 logger = logging.getLogger(__name__)
@@ -53,9 +63,20 @@ from themuse_scraper import TheMuseScraper
 from wellfound_scraper import WellfoundScraper
 from unstop_scraper import UnstopScraper
 from data_validator import validate_opportunity
+from base_scraper import create_session
+from response_cache import get_response_cache
 
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+except ImportError:
+    import json
 
-@dataclass
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+
+@dataclass(slots=True)
 class ScraperMetrics:
     """Runtime metrics for a single scraper run."""
     source: str
@@ -73,7 +94,7 @@ class ScraperMetrics:
     error_message: str = ""
 
 
-@dataclass  
+@dataclass(slots=True)
 class PipelineMetrics:
     """Aggregated metrics for entire pipeline run."""
     start_time: float = 0
@@ -89,6 +110,40 @@ class PipelineMetrics:
     total_saved: int = 0
     total_errors: int = 0
     source_metrics: Dict[str, ScraperMetrics] = field(default_factory=dict)
+    
+    def record(self, metrics: ScraperMetrics):
+        """Store one source's metrics and fold its counts into the totals."""
+        self.source_metrics[metrics.source] = metrics
+        self.total_fetched += metrics.fetched
+        self.total_valid += metrics.valid
+        self.total_invalid += metrics.invalid
+        self.total_duplicates += metrics.duplicates
+        self.total_saved += metrics.saved
+        self.total_errors += metrics.errors
+
+
+def _resolve_scraper_class(name: str, class_name: str) -> type:
+    """Import `<name>_scraper` and return its `class_name` attribute."""
+    module_name = f"{name}_scraper"
+    module = importlib.import_module(module_name)
+    scraper_class = getattr(module, class_name, None)
+    if not scraper_class:
+        raise ImportError(f"Could not find {class_name} in {module_name}")
+    return scraper_class
+
+
+@functools.lru_cache(maxsize=None)
+def _probe_optional(name: str, class_name: str) -> Optional[type]:
+    """Return the optional scraper's class, or None if it cannot be imported.
+
+    Failures are cached as well, so a missing module is probed once per
+    process rather than on every scheduled tick.
+    """
+    try:
+        return _resolve_scraper_class(name, class_name)
+    except ImportError as e:
+        logger.debug("Optional scraper %s not available: %s", name, e)
+        return None
 
 
 class ScraperOrchestrator:
@@ -99,10 +154,17 @@ class ScraperOrchestrator:
     - Full logging (no print statements)
     - Per-source runtime metrics
     - Data validation stage
-    - Deduplication enforcement at orchestrator level
+    - Deduplication enforcement (each scraper checks the database)
     - Zero-result alerts
+    - Concurrent scraper runs (each source is I/O-bound on its own host)
     """
     
+    # Upper bound on scrapers running at the same time
+    MAX_WORKERS = 8
+    
+    # One JSON line of pipeline metrics is appended here per run
+    STATS_FILE = os.path.join(LOG_DIR, 'scraper_stats.jsonl')
+    
     SCRAPERS = {
         'reddit': {
             'class': MultiRedditScraper,
@@ -118,8 +180,9 @@ class ScraperOrchestrator:
         },
         'remotive': {
             'class': RemotiveScraper,
-            'args': {'limit': 50},
-            'quick_args': {'limit': 20},
+            # `limit` applies per category; categories are fetched concurrently
+            'args': {'limit': 25, 'categories': RemotiveScraper.CATEGORIES},
+            'quick_args': {'limit': 10, 'categories': ['software-dev', 'data']},
             'description': 'Remotive.io remote jobs',
         },
         'jsearch': {
@@ -163,32 +226,67 @@ class ScraperOrchestrator:
     OPTIONAL_SCRAPERS = {
         'internshala': {
             'class': None,
+            'class_name': 'InternshalaScraper',  # resolved from internshala_scraper
             'args': {'max_per_category': 15},
             'quick_args': {'max_per_category': 5},
             'description': 'Internshala (India internships)',
         },
     }
     
-    def __init__(self, quick_mode: bool = False):
+    def __init__(self, quick_mode: bool = False, parallel: bool = True, force_rescrape: bool = False):
         self.quick_mode = quick_mode
+        self.parallel = parallel  # False runs scrapers one at a time (debugging)
+        self.force_rescrape = force_rescrape  # Ignore cached API responses
         self.pipeline_metrics = PipelineMetrics()
-        self._seen_urls: Set[str] = set()  # For cross-source deduplication
+        # One keep-alive pool shared by every scraper this orchestrator runs
+        self.http = create_session(pool_connections=16, pool_maxsize=32)
+        self._resolved_scrapers: Optional[Mapping[str, dict]] = None
+        self._instances: Dict[str, object] = {}  # Scrapers reused across runs
     
-    def _load_existing_urls(self):
-        """Load existing job URLs from database for deduplication."""
-        from core.models import Job
-        self._seen_urls = set(Job.objects.values_list('apply_link', flat=True))
-        logger.info(f"Loaded {len(self._seen_urls)} existing job URLs for deduplication")
+    def __enter__(self):
+        return self
     
-    def _is_duplicate(self, url: str) -> bool:
-        """Check if URL already exists (cross-source dedup)."""
-        if url in self._seen_urls:
-            return True
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
         return False
     
-    def _mark_seen(self, url: str):
-        """Mark URL as seen to prevent cross-source duplicates."""
-        self._seen_urls.add(url)
+    def close(self):
+        """Close pooled HTTP connections."""
+        self.http.close()
+    
+    def _all_scrapers(self) -> Mapping[str, dict]:
+        """
+        Return built-in plus importable optional scrapers, resolved once.
+        
+        The merged registry is read-only; callers filter it into a new dict.
+        """
+        if self._resolved_scrapers is None:
+            merged = {**self.SCRAPERS}
+            # Optional classes are imported here, once, so run_scraper only
+            # ever sees configs whose 'class' is already set
+            for name, config in self.OPTIONAL_SCRAPERS.items():
+                scraper_class = _probe_optional(name, config['class_name'])
+                if scraper_class is not None:
+                    merged[name] = {**config, 'class': scraper_class}
+            self._resolved_scrapers = MappingProxyType(merged)
+        return self._resolved_scrapers
+    
+    def _get_scraper(self, name: str, config: dict, args: dict):
+        """
+        Return the scraper instance for name, building it on first use.
+        
+        Scheduled ticks reuse instances instead of re-running constructors;
+        run() resets the per-run counters. Rate limiting and the response
+        cache are process-wide either way, so a tick that starts within
+        `cache_ttl` of the previous one reuses those API payloads (and
+        their jobs come back as duplicates); use force_rescrape to refetch.
+        """
+        scraper = self._instances.get(name)
+        if scraper is None:
+            # Run the scraper on the orchestrator's shared connection pool
+            scraper = config['class'](**args, session=self.http)
+            self._instances[name] = scraper
+        return scraper
     
     def run_scraper(self, name: str, config: dict) -> ScraperMetrics:
         """
@@ -196,25 +294,20 @@ class ScraperOrchestrator:
         """
         source_logger = get_scraper_logger(name)
         metrics = ScraperMetrics(source=name)
-        metrics.start_time = time.time()
+        metrics.start_time = time.perf_counter()
         
         try:
-            # Dynamic class loading
-            scraper_class = config['class']
-            if scraper_class is None:
-                module_name = f"{name}_scraper"
-                source_logger.info(f"Loading {module_name} dynamically")
-                module = __import__(module_name)
-                scraper_class = getattr(module, f"{name.title()}Scraper", None)
-                if not scraper_class:
-                    raise ImportError(f"Could not find scraper class in {module_name}")
+            # Unresolved optional entries (e.g. passed straight from
+            # OPTIONAL_SCRAPERS) are skipped rather than called
+            if config['class'] is None:
+                raise ImportError(f"{name} scraper class is not available")
             
             args = config['quick_args'] if self.quick_mode else config['args']
-            source_logger.info(f"Starting scraper | mode={'quick' if self.quick_mode else 'full'} | args={args}")
+            source_logger.info(
+                "Starting scraper | mode=%s | args=%s", 'quick' if self.quick_mode else 'full', args
+            )
             
-            # Run the scraper
-            scraper = scraper_class(**args)
-            stats = scraper.run()
+            stats = self._get_scraper(name, config, args).run()
             
             # Update metrics from scraper stats
             metrics.fetched = stats.get('fetched', 0)
@@ -228,138 +321,167 @@ class ScraperOrchestrator:
             
             # ISSUE 5: Zero-result alert
             if metrics.fetched == 0:
-                source_logger.warning(f"ALERT: {name} returned 0 jobs! Possible scraper issue.")
+                source_logger.warning("ALERT: %s returned 0 jobs! Possible scraper issue.", name)
                 metrics.status = "warning"
             elif metrics.saved == 0 and metrics.duplicates == 0:
-                source_logger.warning(f"ALERT: {name} had 0 valid jobs! Check data quality.")
+                source_logger.warning("ALERT: %s had 0 valid jobs! Check data quality.", name)
                 metrics.status = "warning"
             
         except ImportError as e:
             metrics.status = "skipped"
             metrics.error_message = str(e)
-            source_logger.warning(f"Skipped: {e}")
+            source_logger.warning("Skipped: %s", e)
             
         except Exception as e:
             metrics.status = "error"
             metrics.error_message = str(e)
             metrics.errors = 1
-            source_logger.error(f"Error: {e}", exc_info=True)
+            source_logger.error("Error: %s", e, exc_info=True)
         
         # ISSUE 2: Calculate duration
-        metrics.end_time = time.time()
-        metrics.duration = round(metrics.end_time - metrics.start_time, 2)
+        metrics.end_time = time.perf_counter()
+        metrics.duration = metrics.end_time - metrics.start_time
         
         # Log completion with timing
         source_logger.info(
-            f"Completed in {metrics.duration}s | "
-            f"fetched={metrics.fetched} valid={metrics.valid} invalid={metrics.invalid} "
-            f"saved={metrics.saved} duplicates={metrics.duplicates}"
+            "Completed in %.2fs | fetched=%d valid=%d invalid=%d saved=%d duplicates=%d",
+            metrics.duration, metrics.fetched, metrics.valid, metrics.invalid,
+            metrics.saved, metrics.duplicates,
+            extra={
+                'event': 'scraper_done',
+                'source': name,
+                'status': metrics.status,
+                'duration': metrics.duration,
+                'fetched': metrics.fetched,
+                'valid': metrics.valid,
+                'invalid': metrics.invalid,
+                'saved': metrics.saved,
+                'duplicates': metrics.duplicates,
+                'errors': metrics.errors,
+                'retries': metrics.retries,
+            },
         )
         
         return metrics
     
+    def _run_scraper_worker(self, name: str, config: dict) -> ScraperMetrics:
+        """Run a scraper on a pool thread and release its DB connection."""
+        from django.db import connection
+        
+        logger.info("RUNNING: %s", name)
+        try:
+            return self.run_scraper(name, config)
+        finally:
+            # Django connections are per-thread; don't leak one per worker
+            connection.close()
+    
     def run_pipeline(self, sources: List[str] = None) -> PipelineMetrics:
         """
         Run the complete scraping pipeline.
         
         Stages:
-        1. Load existing data for deduplication
-        2. Run each scraper with try-except
-        3. Aggregate metrics
-        4. Log summary with alerts
+        1. Run scrapers concurrently, each with try-except
+        2. Finalize metrics (totals are summed as scrapers complete)
+        3. Log summary with alerts
+        
+        Duplicates are dropped when each scraper saves: BaseScraper checks
+        apply_link against the database and bulk_create ignores conflicts.
         """
         self.pipeline_metrics = PipelineMetrics()
-        self.pipeline_metrics.start_time = time.time()
+        self.pipeline_metrics.start_time = time.perf_counter()
         
-        # Stage 1: Load existing URLs for deduplication
         logger.info("=" * 60)
         logger.info("PIPELINE START")
         logger.info("=" * 60)
-        self._load_existing_urls()
+        if self.force_rescrape:
+            get_response_cache().clear()
         
         # Build scraper list
-        all_scrapers = {**self.SCRAPERS}
-        for name, config in self.OPTIONAL_SCRAPERS.items():
-            try:
-                module_name = f"{name}_scraper"
-                __import__(module_name)
-                all_scrapers[name] = config
-            except ImportError:
-                logger.debug(f"Optional scraper {name} not available")
-        
+        all_scrapers = self._all_scrapers()
         if sources:
             all_scrapers = {k: v for k, v in all_scrapers.items() if k in sources}
         
-        logger.info(f"Running {len(all_scrapers)} scrapers: {', '.join(all_scrapers.keys())}")
+        logger.info("Running %d scrapers: %s", len(all_scrapers), ', '.join(all_scrapers))
         
-        # Stage 2: Run each scraper
-        for name, config in all_scrapers.items():
-            logger.info("-" * 40)
-            logger.info(f"RUNNING: {name}")
-            logger.info("-" * 40)
-            
-            try:
-                metrics = self.run_scraper(name, config)
-                self.pipeline_metrics.source_metrics[name] = metrics
-                
-                if metrics.status == "success" or metrics.status == "warning":
-                    self.pipeline_metrics.sources_success += 1
-                elif metrics.status == "error":
-                    self.pipeline_metrics.sources_failed += 1
+        # Stage 1: Run scrapers concurrently; results are collected on this thread
+        # and totals are aggregated as each scraper completes.
+        pm = self.pipeline_metrics
+        workers = max(1, min(self.MAX_WORKERS, len(all_scrapers))) if self.parallel else 1
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scraper") as pool:
+            futures = {
+                pool.submit(self._run_scraper_worker, name, config): name
+                for name, config in all_scrapers.items()
+            }
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    metrics = future.result()
+                    pm.record(metrics)
                     
-            except Exception as e:
-                logger.error(f"Unexpected error with {name}: {e}", exc_info=True)
-                self.pipeline_metrics.sources_failed += 1
-                self.pipeline_metrics.source_metrics[name] = ScraperMetrics(
-                    source=name,
-                    status="error",
-                    error_message=str(e)
-                )
-        
-        # Stage 3: Aggregate metrics
-        self.pipeline_metrics.end_time = time.time()
-        self.pipeline_metrics.total_duration = round(
-            self.pipeline_metrics.end_time - self.pipeline_metrics.start_time, 2
-        )
-        self.pipeline_metrics.sources_run = len(all_scrapers)
+                    if metrics.status == "success" or metrics.status == "warning":
+                        pm.sources_success += 1
+                    elif metrics.status == "error":
+                        pm.sources_failed += 1
+                        
+                except Exception as e:
+                    logger.error("Unexpected error with %s: %s", name, e, exc_info=True)
+                    pm.sources_failed += 1
+                    pm.record(ScraperMetrics(
+                        source=name,
+                        status="error",
+                        error_message=str(e)
+                    ))
         
-        for metrics in self.pipeline_metrics.source_metrics.values():
-            self.pipeline_metrics.total_fetched += metrics.fetched
-            self.pipeline_metrics.total_valid += metrics.valid
-            self.pipeline_metrics.total_invalid += metrics.invalid
-            self.pipeline_metrics.total_duplicates += metrics.duplicates
-            self.pipeline_metrics.total_saved += metrics.saved
-            self.pipeline_metrics.total_errors += metrics.errors
+        # Stage 2: Finalize pipeline metrics
+        pm.end_time = time.perf_counter()
+        pm.total_duration = pm.end_time - pm.start_time
+        pm.sources_run = len(all_scrapers)
         
-        # Stage 4: Log summary
+        # Stage 3: Log summary
         self._log_pipeline_summary()
+        self._write_stats()
         
         return self.pipeline_metrics
     
+    def _write_stats(self):
+        """Append this run's metrics to STATS_FILE as one JSON line."""
+        # start_time/end_time are perf_counter offsets, meaningless outside
+        # this process; durations and the wall-clock run_at are kept
+        record = {'run_at': datetime.now().isoformat(), **asdict(self.pipeline_metrics)}
+        for metrics in (record, *record['source_metrics'].values()):
+            del metrics['start_time'], metrics['end_time']
+        try:
+            os.makedirs(os.path.dirname(self.STATS_FILE), exist_ok=True)
+            with open(self.STATS_FILE, 'ab') as f:
+                f.write(_json_dumps(record) + b'\n')
+        except OSError as e:
+            logger.warning("Could not write pipeline stats to %s: %s", self.STATS_FILE, e)
+    
     def _log_pipeline_summary(self):
         """Log comprehensive pipeline summary with all metrics."""
         pm = self.pipeline_metrics
         
-        logger.info("=" * 60)
-        logger.info("PIPELINE COMPLETE")
-        logger.info("=" * 60)
+        lines = ["=" * 60, "PIPELINE COMPLETE", "=" * 60]
         
         # Per-source timing (ISSUE 2)
-        logger.info("Per-Source Metrics:")
+        lines.append("Per-Source Metrics:")
         for name, m in pm.source_metrics.items():
             status_icon = "[OK]" if m.status == "success" else ("[WARN]" if m.status == "warning" else "[FAIL]")
-            logger.info(
-                f"  {name}: {status_icon} {m.duration}s | "
+            lines.append(
+                f"  {name}: {status_icon} {m.duration:.2f}s | "
                 f"fetched={m.fetched} saved={m.saved} duplicates={m.duplicates}"
             )
         
         # Totals
-        logger.info("-" * 40)
-        logger.info(f"Sources: {pm.sources_run} run, {pm.sources_success} success, {pm.sources_failed} failed")
-        logger.info(f"Jobs: {pm.total_fetched} fetched, {pm.total_valid} valid, {pm.total_invalid} invalid")
-        logger.info(f"Storage: {pm.total_saved} saved, {pm.total_duplicates} duplicates")
-        logger.info(f"Total pipeline time: {pm.total_duration}s")
-        logger.info("=" * 60)
+        lines.append("-" * 40)
+        lines.append(f"Sources: {pm.sources_run} run, {pm.sources_success} success, {pm.sources_failed} failed")
+        lines.append(f"Jobs: {pm.total_fetched} fetched, {pm.total_valid} valid, {pm.total_invalid} invalid")
+        lines.append(f"Storage: {pm.total_saved} saved, {pm.total_duplicates} duplicates")
+        lines.append(f"Total pipeline time: {pm.total_duration:.2f}s")
+        lines.append("=" * 60)
+        
+        # One record so the summary stays contiguous in every handler
+        logger.info("\n".join(lines))
         
         # Alerts (ISSUE 5)
         if pm.total_fetched == 0:
@@ -368,34 +490,28 @@ class ScraperOrchestrator:
             logger.warning("WARNING: No new jobs saved (all duplicates or invalid)")
         
         if pm.sources_failed > 0:
-            logger.warning(f"WARNING: {pm.sources_failed} scraper(s) failed")
+            logger.warning("WARNING: %d scraper(s) failed", pm.sources_failed)
         
         if pm.total_invalid > 0:
-            logger.warning(f"WARNING: {pm.total_invalid} jobs failed validation")
+            logger.warning("WARNING: %d jobs failed validation", pm.total_invalid)
     
     def get_scraper_functions(self, sources: List[str] = None) -> Dict[str, callable]:
         """Get dict of scraper name to run function for scheduler."""
-        all_scrapers = {**self.SCRAPERS}
-        
-        for name, config in self.OPTIONAL_SCRAPERS.items():
-            try:
-                __import__(f"{name}_scraper")
-                all_scrapers[name] = config
-            except ImportError:
-                pass
-        
+        all_scrapers = self._all_scrapers()
         if sources:
             all_scrapers = {k: v for k, v in all_scrapers.items() if k in sources}
         
-        funcs = {}
-        for name, config in all_scrapers.items():
-            def make_runner(n, c):
-                def runner():
-                    return self.run_scraper(n, c)
-                return runner
-            funcs[name] = make_runner(name, config)
-        
-        return funcs
+        # Scheduled ticks bypass run_pipeline, so honour force_rescrape here
+        runner = self._run_scraper_fresh if self.force_rescrape else self.run_scraper
+        return {
+            name: functools.partial(runner, name, config)
+            for name, config in all_scrapers.items()
+        }
+    
+    def _run_scraper_fresh(self, name: str, config: dict) -> ScraperMetrics:
+        """Run one scraper after dropping cached API responses."""
+        get_response_cache().clear()
+        return self.run_scraper(name, config)
 
 
 def run_scheduled(orchestrator: ScraperOrchestrator, sources: List[str], interval_minutes: int = None):
@@ -403,7 +519,15 @@ def run_scheduled(orchestrator: ScraperOrchestrator, sources: List[str], interva
     try:
         from scheduler import create_scheduled_runner
         
-        scraper_funcs = orchestrator.get_scraper_functions(sources)
+        if interval_minutes:
+            # One pipeline job per tick: the pipeline already fans scrapers
+            # out over its thread pool and shares one connection pool, so
+            # separate per-scraper jobs only add overhead.
+            scraper_funcs = {
+                'pipeline': functools.partial(orchestrator.run_pipeline, sources=sources)
+            }
+        else:
+            scraper_funcs = orchestrator.get_scraper_functions(sources)
         
         scheduler = create_scheduled_runner(
             scraper_funcs,
@@ -419,7 +543,7 @@ def run_scheduled(orchestrator: ScraperOrchestrator, sources: List[str], interva
         scheduler.start()
         
     except ImportError as e:
-        logger.error(f"Scheduler not available: {e}")
+        logger.error("Scheduler not available: %s", e)
         logger.error("Install APScheduler: pip install apscheduler")
         sys.exit(1)
 
@@ -432,15 +556,27 @@ def main():
     parser.add_argument('--scheduled', action='store_true', help='Run in scheduler mode')
     parser.add_argument('--interval', type=int, help='Interval in minutes for scheduled runs')
     parser.add_argument('--enrich', action='store_true', help='Run AI enrichment after scraping')
+    parser.add_argument('-p', '--parallel', action=argparse.BooleanOptionalAction, default=True,
+                        help='Run scrapers concurrently (--no-parallel runs them one at a time)')
+    parser.add_argument('--force-rescrape', action='store_true',
+                        help='Ignore cached API responses and refetch everything')
     
     args = parser.parse_args()
     
-    orchestrator = ScraperOrchestrator(quick_mode=args.quick)
-    
+    with ScraperOrchestrator(
+        quick_mode=args.quick,
+        parallel=args.parallel,
+        force_rescrape=args.force_rescrape,
+    ) as orchestrator:
+        _run(orchestrator, args)
+
+
+def _run(orchestrator: ScraperOrchestrator, args: argparse.Namespace):
+    """Dispatch the parsed CLI arguments to the orchestrator."""
     if args.list:
         logger.info("Available scrapers:")
-        for name, config in {**orchestrator.SCRAPERS, **orchestrator.OPTIONAL_SCRAPERS}.items():
-            logger.info(f"  {name}: {config['description']}")
+        for name, config in orchestrator._all_scrapers().items():
+            logger.info("  %s: %s", name, config['description'])
         return
     
     sources = args.source.split(',') if args.source else None
@@ -452,11 +588,11 @@ def main():
     
     # One-time run
     logger.info("=" * 60)
-    logger.info(f"NextStep AI Scraper Orchestrator")
-    logger.info(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    logger.info(f"Mode: {'Quick' if args.quick else 'Full'}")
+    logger.info("NextStep AI Scraper Orchestrator")
+    logger.info("Time: %s", datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+    logger.info("Mode: %s", 'Quick' if args.quick else 'Full')
     if sources:
-        logger.info(f"Sources: {', '.join(sources)}")
+        logger.info("Sources: %s", ', '.join(sources))
     if args.enrich:
         logger.info("Post-scrape enrichment: ENABLED")
     logger.info("=" * 60)
@@ -473,7 +609,7 @@ def main():
             from enrich_jobs import enrich_jobs
             enrich_jobs(limit=metrics.total_saved)
         except Exception as e:
-            logger.error(f"Enrichment failed: {e}")
+            logger.error("Enrichment failed: %s", e)
     elif args.enrich:
         logger.info("No new jobs saved, skipping enrichment")
 
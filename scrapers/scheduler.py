@@ -8,53 +8,102 @@ Compatible with APScheduler 3.x and 4.x.
 
 import os
 import sys
+import asyncio
+import functools
 import logging
+import signal
 import threading
-import time
 from datetime import datetime
-from typing import Dict, Optional, Callable
+from importlib.metadata import PackageNotFoundError, version as _pkg_version
+from types import SimpleNamespace
+from typing import Dict, Optional, Callable, Tuple
 
 # Setup Django
-BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRAPERS_DIR = os.path.dirname(os.path.abspath(__file__))
+BASE_DIR = os.path.dirname(SCRAPERS_DIR)
 PROJECT_DIR = os.path.join(BASE_DIR, "nextstep")
-sys.path.insert(0, PROJECT_DIR)
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+# Only prepend entries that are missing so repeated imports don't grow sys.path
+sys.path[:0] = [path for path in (SCRAPERS_DIR, PROJECT_DIR) if path not in sys.path]
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "nextstep.settings")
 
-# Detect APScheduler version and import accordingly
-APSCHEDULER_AVAILABLE = False
-APSCHEDULER_V4 = False
+from scheduler_config import SCHEDULER_CONFIG, DEFAULT_SCHEDULE, SCHEDULER_SETTINGS, schedule_kind
+
+logger = logging.getLogger(__name__)
 
-try:
-    import apscheduler
-    version = getattr(apscheduler, '__version__', '3.0.0')
-    major_version = int(version.split('.')[0])
-    APSCHEDULER_V4 = major_version >= 4
-except Exception:
-    pass
 
-if APSCHEDULER_V4:
+@functools.lru_cache(maxsize=None)
+def _apscheduler() -> Optional[SimpleNamespace]:
+    """
+    Import APScheduler on first use and return the classes we need.
+    
+    Deferred so importing this module (e.g. just for create_scheduled_runner)
+    does not pay for APScheduler and its timezone dependencies.
+    
+    Returns:
+        Namespace with `v4` plus scheduler/trigger classes, or None if
+        APScheduler is not installed
+    """
+    # Read the version from installed metadata rather than importing the package
     try:
-        from apscheduler import Scheduler
-        from apscheduler.triggers.interval import IntervalTrigger
-        from apscheduler.triggers.cron import CronTrigger
-        APSCHEDULER_AVAILABLE = True
-    except ImportError:
-        pass
-else:
+        version = _pkg_version("apscheduler")
+    except PackageNotFoundError:
+        version = '0'
+    try:
+        is_v4 = int(version.split('.')[0]) >= 4
+    except ValueError:
+        is_v4 = False
+    
     try:
+        if is_v4:
+            from apscheduler import AsyncScheduler, Scheduler
+            from apscheduler.triggers.interval import IntervalTrigger
+            from apscheduler.triggers.cron import CronTrigger
+            return SimpleNamespace(
+                v4=True,
+                AsyncScheduler=AsyncScheduler,
+                Scheduler=Scheduler,
+                CronTrigger=CronTrigger,
+                IntervalTrigger=IntervalTrigger,
+            )
         from apscheduler.schedulers.blocking import BlockingScheduler
         from apscheduler.schedulers.background import BackgroundScheduler
+        from apscheduler.executors.pool import ThreadPoolExecutor
         from apscheduler.triggers.cron import CronTrigger
         from apscheduler.triggers.interval import IntervalTrigger
-        APSCHEDULER_AVAILABLE = True
+        return SimpleNamespace(
+            v4=False,
+            BlockingScheduler=BlockingScheduler,
+            BackgroundScheduler=BackgroundScheduler,
+            ThreadPoolExecutor=ThreadPoolExecutor,
+            CronTrigger=CronTrigger,
+            IntervalTrigger=IntervalTrigger,
+        )
     except ImportError:
-        pass
+        return None
 
-from scheduler_config import SCHEDULER_CONFIG, DEFAULT_SCHEDULE
 
-logger = logging.getLogger(__name__)
+def apscheduler_available() -> bool:
+    """Check whether APScheduler can be imported."""
+    return _apscheduler() is not None
+
+
+def _schedule_info(schedule: Dict) -> Tuple[str, Dict]:
+    """Return the validated (kind, params) pair of a schedule dict."""
+    kind = schedule_kind(schedule)
+    return kind, schedule[kind]
+
+
+def _build_trigger(kind: str, params: Dict):
+    """
+    Build a new APScheduler trigger for a (kind, params) pair.
+    
+    Triggers are not shared between jobs: 4.x triggers track their last
+    fire time and a 3.x IntervalTrigger fixes its start date when built.
+    """
+    aps = _apscheduler()
+    trigger_cls = aps.CronTrigger if kind == 'cron' else aps.IntervalTrigger
+    return trigger_cls(**params)
 
 
 class ScraperScheduler:
@@ -66,27 +115,77 @@ class ScraperScheduler:
     """
     
     def __init__(self, blocking: bool = True, config: Dict = None):
-        if not APSCHEDULER_AVAILABLE:
+        aps = _apscheduler()
+        if aps is None:
             raise ImportError(
                 "APScheduler is required for scheduling. "
                 "Install it with: pip install apscheduler"
             )
         
+        self._aps = aps
         self.config = config or SCHEDULER_CONFIG
         self.blocking = blocking
-        self.jobs_info = {}
-        self._shutdown_event = threading.Event()
+        self.jobs_info: Dict[str, Tuple[str, Dict]] = {}  # job name -> (kind, params)
         self._is_running = False
         
-        if APSCHEDULER_V4:
-            self.scheduler = Scheduler()
+        if aps.v4:
+            if blocking:
+                # Driven from an event loop in start(); schedules are queued
+                # until the scheduler has been entered there
+                self.scheduler = aps.AsyncScheduler()
+            else:
+                self.scheduler = aps.Scheduler()
+            self._pending_v4 = []
+            self._loop = None
             self._is_v4 = True
         else:
+            # A firing delayed within this process (busy pool, long job) still
+            # runs inside the grace window, a backlog collapses into one
+            # catch-up run, and a job never overlaps a still-running instance
+            # of itself. Jobs live in memory, so nothing survives a restart.
+            job_defaults = {
+                'misfire_grace_time': SCHEDULER_SETTINGS['misfire_grace_time'],
+                'coalesce': True,
+                'max_instances': 1,
+            }
+            # One bounded pool for all jobs, capped at max_concurrent scrapers
+            executors = {
+                'default': aps.ThreadPoolExecutor(max_workers=SCHEDULER_SETTINGS['max_concurrent']),
+            }
             if blocking:
-                self.scheduler = BlockingScheduler()
+                self.scheduler = aps.BlockingScheduler(executors=executors, job_defaults=job_defaults)
             else:
-                self.scheduler = BackgroundScheduler()
+                self.scheduler = aps.BackgroundScheduler(executors=executors, job_defaults=job_defaults)
             self._is_v4 = False
+        
+        # Resolve the version-specific registration call once
+        if not self._is_v4:
+            self._add_job = self._add_job_v3
+        elif blocking:
+            self._add_job = self._queue_job_v4
+        else:
+            self._add_job = self._add_job_v4
+    
+    def _add_job_v3(self, func: Callable, trigger, name: str):
+        self.scheduler.add_job(
+            func,
+            trigger=trigger,
+            id=name,
+            name=f"Scraper: {name}",
+            replace_existing=True,
+        )
+    
+    def _add_job_v4(self, func: Callable, trigger, name: str):
+        self.scheduler.add_schedule(func, trigger, id=name)
+    
+    def _queue_job_v4(self, func: Callable, trigger, name: str):
+        self._pending_v4.append((func, trigger, name))
+    
+    def _register(self, name: str, func: Callable, trigger, schedule_info: Tuple[str, Dict]):
+        """Add a job to the scheduler and record its schedule."""
+        self._add_job(func, trigger, name)
+        self.jobs_info[name] = schedule_info
+        logger.info("Added %s with %s: %s", name, *schedule_info)
     
     def add_scraper(
         self,
@@ -95,32 +194,8 @@ class ScraperScheduler:
         schedule: Optional[Dict] = None,
     ):
         """Add a scraper to the schedule."""
-        schedule = schedule or self.config.get(name, DEFAULT_SCHEDULE)
-        
-        if 'cron' in schedule:
-            trigger = CronTrigger(**schedule['cron'])
-            schedule_desc = f"cron: {schedule['cron']}"
-        elif 'interval' in schedule:
-            trigger = IntervalTrigger(**schedule['interval'])
-            schedule_desc = f"interval: {schedule['interval']}"
-        else:
-            trigger = IntervalTrigger(hours=6)
-            schedule_desc = "interval: 6 hours (default)"
-        
-        if self._is_v4:
-            self.scheduler.add_schedule(func, trigger, id=name)
-        else:
-            self.scheduler.add_job(
-                func,
-                trigger=trigger,
-                id=name,
-                name=f"Scraper: {name}",
-                replace_existing=True,
-                max_instances=1,
-            )
-        
-        self.jobs_info[name] = {'schedule': schedule_desc}
-        logger.info(f"Added {name} with {schedule_desc}")
+        schedule_info = _schedule_info(schedule or self.config.get(name, DEFAULT_SCHEDULE))
+        self._register(name, func, _build_trigger(*schedule_info), schedule_info)
     
     def add_interval_job(
         self,
@@ -131,43 +206,28 @@ class ScraperScheduler:
     ):
         """Add a simple interval-based job."""
         if minutes:
-            trigger = IntervalTrigger(minutes=minutes)
-            schedule_desc = f"every {minutes} minutes"
+            params = {'minutes': minutes}
         elif hours:
-            trigger = IntervalTrigger(hours=hours)
-            schedule_desc = f"every {hours} hours"
-        else:
-            trigger = IntervalTrigger(hours=1)
-            schedule_desc = "every 1 hour (default)"
-        
-        if self._is_v4:
-            self.scheduler.add_schedule(func, trigger, id=name)
+            params = {'hours': hours}
         else:
-            self.scheduler.add_job(
-                func,
-                trigger=trigger,
-                id=name,
-                name=f"Scraper: {name}",
-                replace_existing=True,
-                max_instances=1,
-            )
+            params = {'hours': 1}
         
-        self.jobs_info[name] = {'schedule': schedule_desc}
-        logger.info(f"Added {name} with {schedule_desc}")
+        trigger = self._aps.IntervalTrigger(**params)
+        self._register(name, func, trigger, ('interval', params))
     
     def print_schedule(self):
         """Print the current schedule to console."""
-        print("\n" + "=" * 60)
-        print("SCRAPER SCHEDULE")
-        print("=" * 60)
+        lines = ["", "=" * 60, "SCRAPER SCHEDULE", "=" * 60]
         
         if not self.jobs_info:
-            print("No jobs scheduled.")
+            lines.append("No jobs scheduled.")
         else:
-            for name, info in self.jobs_info.items():
-                print(f"  {name}: {info['schedule']}")
+            for name, (kind, params) in self.jobs_info.items():
+                lines.append(f"  {name}: {kind}: {params}")
         
-        print("=" * 60 + "\n")
+        lines.append("=" * 60 + "\n")
+        # Single write so the block is not interleaved with log output
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def start(self):
         """Start the scheduler."""
@@ -177,17 +237,14 @@ class ScraperScheduler:
         
         print("Scheduler running. Press Ctrl+C to stop.\n")
         
-        if self._is_v4:
-            # For APScheduler 4.x, run in a thread and wait for shutdown
-            scheduler_thread = threading.Thread(
-                target=self._run_v4_scheduler,
-                daemon=True
-            )
-            scheduler_thread.start()
-            
+        if self._is_v4 and not self.blocking:
+            # Background mode genuinely needs its own thread
+            threading.Thread(target=self._run_v4_scheduler, daemon=True).start()
+        elif self._is_v4:
+            # Run the async scheduler on an event loop on this thread;
+            # Ctrl+C stops it, which returns from run_until_stopped()
             try:
-                while not self._shutdown_event.is_set():
-                    time.sleep(0.5)
+                asyncio.run(self._astart())
             except KeyboardInterrupt:
                 print("\n\nShutdown requested...")
             finally:
@@ -201,20 +258,47 @@ class ScraperScheduler:
             finally:
                 self.stop()
     
+    async def _astart(self):
+        """Enter the v4 AsyncScheduler, add queued schedules and run it."""
+        self._loop = asyncio.get_running_loop()
+        if threading.current_thread() is threading.main_thread():
+            self._loop.add_signal_handler(signal.SIGINT, self._request_shutdown)
+        try:
+            async with self.scheduler:
+                for func, trigger, name in self._pending_v4:
+                    await self.scheduler.add_schedule(func, trigger, id=name)
+                await self.scheduler.run_until_stopped()
+        finally:
+            self._loop = None
+    
+    def _request_shutdown(self):
+        """SIGINT handler: stop the v4 scheduler so start() can return."""
+        print("\n\nShutdown requested...")
+        self.stop()
+    
+    def _stop_async(self):
+        # Keep a reference so the stop task is not garbage collected
+        self._stop_task = self._loop.create_task(self.scheduler.stop())
+    
     def _run_v4_scheduler(self):
         """Run v4 scheduler in background."""
         try:
             self.scheduler.run_until_stopped()
         except Exception as e:
-            logger.error(f"Scheduler error: {e}")
+            logger.error("Scheduler error: %s", e)
     
     def stop(self):
         """Stop the scheduler gracefully."""
-        self._shutdown_event.set()
+        if not self._is_running:
+            return
         self._is_running = False
         
         try:
-            if self._is_v4:
+            if self._is_v4 and self.blocking:
+                # Nothing to do once the event loop has exited
+                if self._loop is not None:
+                    self._loop.call_soon_threadsafe(self._stop_async)
+            elif self._is_v4:
                 self.scheduler.stop()
             else:
                 if hasattr(self.scheduler, 'running') and self.scheduler.running:
@@ -222,7 +306,7 @@ class ScraperScheduler:
             print("Scheduler stopped.")
             logger.info("Scheduler stopped.")
         except Exception as e:
-            logger.warning(f"Error stopping scheduler: {e}")
+            logger.warning("Error stopping scheduler: %s", e)
 
 
 def create_scheduled_runner(
@@ -236,14 +320,21 @@ def create_scheduled_runner(
     Args:
         scrapers: Dict mapping scraper names to their run functions
         interval_minutes: If provided, use this interval for all scrapers
-        use_config: If True, use scheduler_config.py settings
+        use_config: If True, use scheduler_config.py settings (scrapers not
+            listed in SCHEDULER_SETTINGS['enabled_scrapers'] are skipped)
     
     Returns:
         Configured ScraperScheduler instance
     """
     scheduler = ScraperScheduler(blocking=True)
+    enabled = set(SCHEDULER_SETTINGS['enabled_scrapers'])
     
     for name, func in scrapers.items():
+        if use_config and name not in enabled:
+            logger.warning(
+                "Not scheduling %s: not in SCHEDULER_SETTINGS['enabled_scrapers']", name
+            )
+            continue
         if interval_minutes:
             scheduler.add_interval_job(name, func, minutes=interval_minutes)
         elif use_config:
@@ -257,11 +348,11 @@ def create_scheduled_runner(
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
     
-    if not APSCHEDULER_AVAILABLE:
+    if not apscheduler_available():
         print("APScheduler not installed. Run: pip install apscheduler")
         sys.exit(1)
     
-    print(f"APScheduler version: {'4.x' if APSCHEDULER_V4 else '3.x'}")
+    print(f"APScheduler version: {'4.x' if _apscheduler().v4 else '3.x'}")
     
     def dummy_scraper():
         print(f"Dummy scraper ran at {datetime.now()}")
@@ -51,8 +51,12 @@ RETRY_CONFIG = {
 
 # Scheduler behavior settings
 SCHEDULER_SETTINGS = {
-    # Enable/disable specific scrapers
-    'enabled_scrapers': ['reddit', 'hackernews', 'remotive'],
+    # Enable/disable specific scrapers (sources without a SCHEDULER_CONFIG
+    # entry run on DEFAULT_SCHEDULE)
+    'enabled_scrapers': [
+        'reddit', 'hackernews', 'remotive', 'internshala', 'jsearch',
+        'arbeitnow', 'adzuna', 'themuse', 'wellfound', 'unstop',
+    ],
     
     # Use quick mode for scheduled runs (faster, fewer results)
     'quick_mode': False,
@@ -66,3 +70,28 @@ SCHEDULER_SETTINGS = {
     # Misfire grace time (seconds) - max delay before job is considered missed
     'misfire_grace_time': 3600,  # 1 hour
 }
+
+
+def schedule_kind(schedule: dict, name: str = 'schedule') -> str:
+    """
+    Return 'cron' or 'interval' for a schedule dict.
+    
+    Raises:
+        ValueError: If the schedule does not have exactly one of those keys
+    """
+    kinds = [kind for kind in ('cron', 'interval') if kind in schedule]
+    if len(kinds) != 1 or not isinstance(schedule[kinds[0]], dict):
+        raise ValueError(
+            f"Bad schedule for {name}: expected one 'cron' or 'interval' dict, got {schedule!r}"
+        )
+    return kinds[0]
+
+
+def _validate():
+    """Fail at import on typos instead of silently falling back to a default."""
+    schedule_kind(DEFAULT_SCHEDULE, 'default')
+    for name, schedule in SCHEDULER_CONFIG.items():
+        schedule_kind(schedule, name)
+
+
+_validate()
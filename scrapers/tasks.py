@@ -49,7 +49,7 @@ def _store_status(source: str, stats: dict, status: str = 'success') -> None:
 def run_remotive(self):
     try:
         from remotive_scraper import RemotiveScraper
-        stats = RemotiveScraper(limit=50).run()
+        stats = RemotiveScraper(limit=25, categories=RemotiveScraper.CATEGORIES).run()
         _store_status('remotive', stats)
         return stats
     except Exception as exc:
@@ -8,7 +8,8 @@ Filters for 'Flexible / Remote' location — globally accessible roles.
 import os
 import sys
 import logging
-from typing import List, Tuple
+import requests
+from typing import List, Tuple, Optional
 
 from bs4 import BeautifulSoup
 
@@ -40,8 +41,8 @@ class TheMuseScraper(BaseScraper):
         "Product",
     ]
 
-    def __init__(self, limit: int = 100):
-        super().__init__()
+    def __init__(self, limit: int = 100, session: Optional[requests.Session] = None):
+        super().__init__(session=session)
         self.limit = limit
 
     def _clean_html(self, html_text: str) -> str:
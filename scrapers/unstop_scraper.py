@@ -9,7 +9,8 @@ import os
 import sys
 import json
 import logging
-from typing import List
+import requests
+from typing import List, Optional
 
 from bs4 import BeautifulSoup
 
@@ -36,8 +37,8 @@ class UnstopScraper(BaseScraper):
         ("https://unstop.com/internships", "internship"),
     ]
 
-    def __init__(self, limit: int = 60):
-        super().__init__()
+    def __init__(self, limit: int = 60, session: Optional[requests.Session] = None):
+        super().__init__(session=session)
         self.limit = limit
         self.headers.update({
             "Accept": "text/html,application/xhtml+xml",
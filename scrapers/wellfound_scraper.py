@@ -10,7 +10,8 @@ import os
 import sys
 import json
 import logging
-from typing import List
+import requests
+from typing import List, Optional
 
 from bs4 import BeautifulSoup
 
@@ -45,8 +46,8 @@ class WellfoundScraper(BaseScraper):
         "devops-engineer",
     ]
 
-    def __init__(self, limit: int = 80):
-        super().__init__()
+    def __init__(self, limit: int = 80, session: Optional[requests.Session] = None):
+        super().__init__(session=session)
         self.limit = limit
         self.headers.update({
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",